@@ -0,0 +1,309 @@
+"""
+Redis-backed job store for the SEC 10-K Report Fetcher API
+
+Job records are shared between the API process (which creates jobs and serves
+their status) and the ARQ worker processes (which execute them).
+
+Layout:
+- job:{job_id}          - hash with status, timestamps and counters
+- job:{job_id}:results  - list of JSON-encoded per-ticker results
+- job:{job_id}:tickers  - hash indexing the same results by ticker
+- job:{job_id}:response - serialized status response of a finished job
+- pdf:{ticker}:{dir}    - JSON-encoded result of the latest PDF generated for
+                          a ticker in an output directory
+- sec:rate_limited      - set while the SEC API is rate limiting us; its TTL
+                          is the remaining Retry-After delay
+- sec:requests:{second} - SEC requests sent by all workers in a one-second
+                          window (see rate_limit.py)
+
+All job keys expire JOB_TTL_SECONDS after the job's last update, so finished
+jobs are reclaimed automatically. Cached PDF results expire after
+PDF_CACHE_TTL_SECONDS.
+"""
+
+import os
+import json
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from arq.connections import RedisSettings
+
+
+# Redis connection used by both the API and the workers
+REDIS_URL = os.getenv("REDIS_URL", "redis://localhost:6379/0")
+REDIS_SETTINGS = RedisSettings.from_dsn(REDIS_URL)
+
+# How long job records are kept after their last update
+JOB_TTL_SECONDS = 24 * 3600
+
+# How long a generated PDF is reused for new jobs requesting the same ticker
+PDF_CACHE_TTL_SECONDS = 12 * 3600
+
+# Redis key flagging an active SEC rate limit back-off
+SEC_BACKOFF_KEY = "sec:rate_limited"
+
+# Job statuses after which a job record no longer changes
+FINAL_JOB_STATUSES = ("completed", "failed")
+
+# Integer fields stored in the job hash
+_COUNTER_FIELDS = ("total_companies", "processed", "successful", "failed")
+
+
+# (unix second, ISO timestamp) of the last coarse timestamp formatted
+_ts_cache = (0, "")
+
+
+def now_iso() -> str:
+    """
+    Current UTC time as an ISO timestamp with one-second resolution.
+
+    The formatted value is reused for all calls within the same second, which
+    is precise enough for health checks.
+    """
+    global _ts_cache
+    now = int(time.time())
+    if now != _ts_cache[0]:
+        _ts_cache = (now, datetime.fromtimestamp(now, tz=timezone.utc).isoformat())
+    return _ts_cache[1]
+
+
+def job_timestamp() -> str:
+    """Current UTC time as an ISO timestamp (millisecond precision) for job records."""
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds")
+
+
+def job_key(job_id: str) -> str:
+    """Redis key of the job hash."""
+    return f"job:{job_id}"
+
+
+def results_key(job_id: str) -> str:
+    """Redis key of the job results list."""
+    return f"job:{job_id}:results"
+
+
+def tickers_key(job_id: str) -> str:
+    """Redis key of the job results indexed by ticker."""
+    return f"job:{job_id}:tickers"
+
+
+def response_key(job_id: str) -> str:
+    """Redis key of the cached status response of a finished job."""
+    return f"job:{job_id}:response"
+
+
+def pdf_cache_key(ticker: str, output_dir: Path) -> str:
+    """Redis key of the cached PDF result for a ticker and output directory."""
+    return f"pdf:{ticker}:{output_dir.resolve()}"
+
+
+def _decode(value) -> str:
+    return value.decode("utf-8") if isinstance(value, bytes) else value
+
+
+async def create_job(redis, job_id: str, total_companies: int, created_at: str) -> None:
+    """
+    Store the initial record of a newly submitted job.
+
+    Args:
+        redis: Redis connection (ArqRedis pool)
+        job_id: Unique job identifier
+        total_companies: Number of companies the job will process
+        created_at: ISO timestamp of job creation
+    """
+    pipe = redis.pipeline()
+    pipe.hset(job_key(job_id), mapping={
+        "job_id": job_id,
+        "status": "started",
+        "created_at": created_at,
+        "completed_at": "",
+        "total_companies": total_companies,
+        "processed": 0,
+        "successful": 0,
+        "failed": 0,
+    })
+    pipe.expire(job_key(job_id), JOB_TTL_SECONDS)
+    await pipe.execute()
+
+
+async def record_result(redis, job_id: str, result: Optional[Dict]) -> None:
+    """
+    Record the outcome of processing a single company.
+
+    Args:
+        redis: Redis connection
+        job_id: Unique job identifier
+        result: Processing result dictionary, or None if processing failed
+    """
+    pipe = redis.pipeline()
+    pipe.hincrby(job_key(job_id), "processed", 1)
+    if result:
+        encoded = json.dumps(result)
+        pipe.hincrby(job_key(job_id), "successful", 1)
+        pipe.rpush(results_key(job_id), encoded)
+        pipe.hset(tickers_key(job_id), result["ticker"], encoded)
+        pipe.expire(results_key(job_id), JOB_TTL_SECONDS)
+        pipe.expire(tickers_key(job_id), JOB_TTL_SECONDS)
+    else:
+        pipe.hincrby(job_key(job_id), "failed", 1)
+    pipe.expire(job_key(job_id), JOB_TTL_SECONDS)
+    await pipe.execute()
+
+
+async def finish_job(redis, job_id: str, status: str, completed_at: str,
+                     error: Optional[str] = None) -> None:
+    """
+    Mark a job as finished.
+
+    Args:
+        redis: Redis connection
+        job_id: Unique job identifier
+        status: Final job status ('completed' or 'failed')
+        completed_at: ISO timestamp of job completion
+        error: Optional error message for failed jobs
+    """
+    fields = {"status": status, "completed_at": completed_at}
+    if error is not None:
+        fields["error"] = error
+    pipe = redis.pipeline()
+    pipe.hset(job_key(job_id), mapping=fields)
+    pipe.expire(job_key(job_id), JOB_TTL_SECONDS)
+    pipe.expire(results_key(job_id), JOB_TTL_SECONDS)
+    pipe.expire(tickers_key(job_id), JOB_TTL_SECONDS)
+    await pipe.execute()
+
+
+async def load_job(redis, job_id: str) -> Optional[Dict]:
+    """
+    Load a job record together with its results.
+
+    Args:
+        redis: Redis connection
+        job_id: Unique job identifier
+
+    Returns:
+        Job dictionary (same shape as the status response) or None if the
+        job does not exist
+    """
+    raw = await redis.hgetall(job_key(job_id))
+    if not raw:
+        return None
+
+    job = {_decode(k): _decode(v) for k, v in raw.items()}
+    for field in _COUNTER_FIELDS:
+        job[field] = int(job[field])
+    job["completed_at"] = job["completed_at"] or None
+
+    raw_results: List = await redis.lrange(results_key(job_id), 0, -1)
+    job["results"] = [json.loads(r) for r in raw_results]
+    return job
+
+
+async def load_job_result(redis, job_id: str, ticker: str) -> Tuple[bool, Optional[Dict]]:
+    """
+    Look up a single ticker's result of a job without loading all results.
+
+    Args:
+        redis: Redis connection
+        job_id: Unique job identifier
+        ticker: Company ticker symbol (upper case)
+
+    Returns:
+        Tuple of (whether the job exists, result dictionary or None)
+    """
+    pipe = redis.pipeline()
+    pipe.exists(job_key(job_id))
+    pipe.hget(tickers_key(job_id), ticker)
+    exists, raw = await pipe.execute()
+    return bool(exists), json.loads(raw) if raw is not None else None
+
+
+async def load_status_response(redis, job_id: str) -> Optional[bytes]:
+    """
+    Get the cached status response of a finished job.
+
+    Args:
+        redis: Redis connection
+        job_id: Unique job identifier
+
+    Returns:
+        Serialized JSON response, or None if the job has no cached response
+    """
+    return await redis.get(response_key(job_id))
+
+
+async def cache_status_response(redis, job_id: str, content: str) -> None:
+    """
+    Cache the status response of a finished job.
+
+    Args:
+        redis: Redis connection
+        job_id: Unique job identifier
+        content: Serialized JSON response
+    """
+    await redis.set(response_key(job_id), content, ex=JOB_TTL_SECONDS)
+
+
+async def get_cached_result(redis, ticker: str, output_dir: Path) -> Optional[Dict]:
+    """
+    Look up a previously generated PDF for a ticker.
+
+    Args:
+        redis: Redis connection
+        ticker: Company ticker symbol
+        output_dir: Output directory the PDF was requested in
+
+    Returns:
+        Cached result dictionary, or None if there is no cached PDF or the
+        file no longer exists
+    """
+    raw = await redis.get(pdf_cache_key(ticker, output_dir))
+    if raw is None:
+        return None
+
+    result = json.loads(raw)
+    if not Path(result["pdf_path"]).exists():
+        return None
+    return result
+
+
+async def cache_result(redis, result: Dict, output_dir: Path) -> None:
+    """
+    Cache the result of a generated PDF for reuse by later jobs.
+
+    Args:
+        redis: Redis connection
+        result: Processing result dictionary
+        output_dir: Output directory the PDF was generated in
+    """
+    await redis.setex(
+        pdf_cache_key(result["ticker"], output_dir),
+        PDF_CACHE_TTL_SECONDS,
+        json.dumps(result)
+    )
+
+
+async def set_sec_backoff(redis, retry_after: int) -> None:
+    """
+    Record that the SEC API asked us to back off.
+
+    Args:
+        redis: Redis connection
+        retry_after: Seconds to wait before contacting the SEC API again
+    """
+    await redis.set(SEC_BACKOFF_KEY, 1, ex=retry_after)
+
+
+async def get_sec_backoff(redis) -> int:
+    """
+    Get the remaining SEC rate limit back-off.
+
+    Args:
+        redis: Redis connection
+
+    Returns:
+        Seconds until the SEC API may be contacted again (0 if not rate limited)
+    """
+    return max(await redis.ttl(SEC_BACKOFF_KEY), 0)
@@ -8,42 +8,137 @@ Endpoints:
 - GET /health - Health check
 - POST /api/v1/reports/fetch - Fetch 10-K reports for given tickers
 - GET /api/v1/reports/status/{job_id} - Get status of a fetch job
+
+Jobs are queued in Redis and executed by ARQ workers (see worker.py), so job
+state survives API restarts and is shared across API processes.
 """
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks
-from fastapi.responses import FileResponse
+from fastapi import FastAPI, HTTPException, Request, Path as PathParam
+from fastapi.responses import FileResponse, Response
+from starlette.concurrency import run_in_threadpool
 from pydantic import BaseModel, Field
-from typing import List, Optional, Dict
+from typing import List, Optional
 from pathlib import Path
+from contextlib import asynccontextmanager
+import os
 import logging
 import uuid
-from datetime import datetime
 import sys
 from pathlib import Path as PathLib
 
+import orjson
+from arq import create_pool
+from slowapi import Limiter
+from slowapi.errors import RateLimitExceeded
+from slowapi.util import get_remote_address
+
 # Add src directory to path for imports
 sys.path.insert(0, str(PathLib(__file__).parent.parent.parent))
 
-from src.sec10k_fetcher import SEC10KFetcher, fetch_10k_reports, TICKER_TO_CIK
-
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+from src.sec10k_fetcher import TICKER_CIK_PAIRS, VALID_TICKERS, configure_logging
+from src.api.jobs import (
+    REDIS_URL,
+    REDIS_SETTINGS,
+    create_job,
+    load_job,
+    load_job_result,
+    load_status_response,
+    cache_status_response,
+    get_sec_backoff,
+    now_iso,
+    job_timestamp,
+    FINAL_JOB_STATUSES,
 )
+
+# Configure logging (written by a background thread)
+configure_logging()
 logger = logging.getLogger(__name__)
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open the Redis job queue pool for the lifetime of the app."""
+    app.state.redis = await create_pool(REDIS_SETTINGS)
+    yield
+    await app.state.redis.aclose()
+
+
 # Initialize FastAPI app
 app = FastAPI(
     title="SEC 10-K Report Fetcher API",
     description="REST API for fetching and converting SEC 10-K reports to PDF",
     version="1.0.0",
     docs_url="/api/docs",
-    redoc_url="/api/redoc"
+    redoc_url="/api/redoc",
+    lifespan=lifespan
 )
 
-# In-memory job store (in production, use Redis or database)
-job_store: Dict[str, Dict] = {}
+# The supported companies are fixed, so their listing is serialized only once
+_COMPANIES_JSON = orjson.dumps({
+    "companies": [
+        {"ticker": ticker, "cik": cik}
+        for ticker, cik in TICKER_CIK_PAIRS
+    ],
+    "total": len(TICKER_CIK_PAIRS)
+})
+
+# Caching policy for downloaded PDFs (reports don't change once generated)
+PDF_CACHE_CONTROL = "public, max-age=3600"
+
+# Job IDs are 32 hex digits; the hyphenated UUID form is still accepted for
+# IDs issued before the switch
+JOB_ID_PATTERN = r"^(?:[0-9a-f]{32}|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12})$"
+
+# Error code of 429 responses, for the admission limit and SEC rate limits alike
+RATE_LIMITED_CODE = "agent.rate_limited"
+
+# Counters of the admission limit are kept in Redis so that all API worker
+# processes share them (e.g. "memory://" keeps them per process)
+RATE_LIMIT_STORAGE_URI = os.getenv("RATE_LIMIT_STORAGE_URI", REDIS_URL)
+
+# Per-client admission limit for job submission
+limiter = Limiter(key_func=get_remote_address, storage_uri=RATE_LIMIT_STORAGE_URI)
+app.state.limiter = limiter
+
+
+def rate_limited_response(code: str, message: str, retry_after: int) -> Response:
+    """
+    Build the 429 response returned when a request is rate limited.
+    
+    Args:
+        code: Machine-readable error code
+        message: Human-readable error message
+        retry_after: Seconds the client should wait before retrying
+    """
+    return Response(
+        content=orjson.dumps({"ok": False, "code": code, "message": message}),
+        status_code=429,
+        headers={"Retry-After": str(retry_after)},
+        media_type="application/json"
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check whether an If-None-Match header matches the given ETag."""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == "*" or tag == etag:
+            return True
+    return False
+
+
+@app.exception_handler(RateLimitExceeded)
+async def rate_limit_exceeded_handler(request: Request, exc: RateLimitExceeded):
+    """Return a stable 429 envelope when a client exceeds the admission limit."""
+    return rate_limited_response(
+        code=RATE_LIMITED_CODE,
+        message=f"Rate limit exceeded: {exc.detail}",
+        retry_after=exc.limit.limit.get_expiry()
+    )
 
 
 # Request/Response Models
@@ -99,39 +194,45 @@ class HealthResponse(BaseModel):
 
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check():
+def health_check():
     """Health check endpoint."""
     return HealthResponse(
         status="healthy",
-        timestamp=datetime.utcnow().isoformat()
+        timestamp=now_iso()
     )
 
 
 @app.post("/api/v1/reports/fetch", response_model=FetchReportsResponse, tags=["Reports"])
-async def fetch_reports(
-    request: FetchReportsRequest,
-    background_tasks: BackgroundTasks
-):
+@limiter.limit("10/second")
+async def fetch_reports(request: Request, fetch_request: FetchReportsRequest):
     """
     Fetch latest 10-K reports for specified companies.
     
     This endpoint accepts a list of company tickers and fetches their latest
     10-K reports, converting them to PDF format.
     
-    The processing happens in the background. Use the job_id to check status.
+    The job is queued and processed by a worker. Use the job_id to check status.
+    Returns 429 with a Retry-After header while the SEC API is rate limiting
+    the workers or when the client submits jobs too quickly.
     """
-    job_id = str(uuid.uuid4())
+    # endpoint must not block: this runs on the event loop, so anything beyond
+    # awaiting Redis and pure-Python validation belongs in the worker job
+    
+    # Propagate an upstream SEC rate limit instead of queuing jobs that would fail
+    retry_after = await get_sec_backoff(app.state.redis)
+    if retry_after:
+        return rate_limited_response(
+            code=RATE_LIMITED_CODE,
+            message="SEC API rate limit exceeded, retry later",
+            retry_after=retry_after
+        )
     
-    # Validate tickers
-    valid_tickers = []
-    invalid_tickers = []
+    job_id = uuid.uuid4().hex
     
-    for ticker in request.tickers:
-        ticker_upper = ticker.upper()
-        if ticker_upper in TICKER_TO_CIK:
-            valid_tickers.append(ticker_upper)
-        else:
-            invalid_tickers.append(ticker_upper)
+    # Validate tickers (duplicates are fetched only once)
+    requested = {ticker.upper() for ticker in fetch_request.tickers}
+    valid_tickers = sorted(requested & VALID_TICKERS)
+    invalid_tickers = sorted(requested - VALID_TICKERS)
     
     if not valid_tickers:
         raise HTTPException(
@@ -140,28 +241,24 @@ async def fetch_reports(
         )
     
     # Initialize job in store
-    job_store[job_id] = {
-        "job_id": job_id,
-        "status": "started",
-        "created_at": datetime.utcnow().isoformat(),
-        "completed_at": None,
-        "total_companies": len(valid_tickers),
-        "processed": 0,
-        "successful": 0,
-        "failed": 0,
-        "results": []
-    }
+    await create_job(
+        app.state.redis,
+        job_id,
+        total_companies=len(valid_tickers),
+        created_at=job_timestamp()
+    )
     
     # Log invalid tickers
     if invalid_tickers:
         logger.warning(f"Invalid tickers ignored: {invalid_tickers}")
     
-    # Schedule background task
-    background_tasks.add_task(
-        process_reports_job,
-        job_id=job_id,
-        tickers=valid_tickers,
-        output_dir=request.output_dir or "./output_pdfs"
+    # Enqueue job for the workers
+    await app.state.redis.enqueue_job(
+        "process_reports_job",
+        job_id,
+        valid_tickers,
+        fetch_request.output_dir or "./output_pdfs",
+        _job_id=job_id
     )
     
     return FetchReportsResponse(
@@ -172,66 +269,27 @@ async def fetch_reports(
     )
 
 
-async def process_reports_job(job_id: str, tickers: List[str], output_dir: str):
-    """
-    Background task to process reports.
-    
-    Args:
-        job_id: Unique job identifier
-        tickers: List of company tickers
-        output_dir: Output directory for PDFs
-    """
-    try:
-        logger.info(f"Starting job {job_id} for tickers: {tickers}")
-        
-        # Process reports
-        results = fetch_10k_reports(tickers=tickers, output_dir=output_dir)
-        
-        # Update job status
-        job_store[job_id].update({
-            "status": "completed",
-            "completed_at": datetime.utcnow().isoformat(),
-            "processed": len(tickers),
-            "successful": len(results),
-            "failed": len(tickers) - len(results),
-            "results": [
-                ReportResult(
-                    ticker=r["ticker"],
-                    cik=r["cik"],
-                    filing_date=r["filing_date"],
-                    accession_number=r["accession_number"],
-                    pdf_path=r["pdf_path"],
-                    status="success"
-                )
-                for r in results
-            ]
-        })
-        
-        logger.info(f"Completed job {job_id}: {len(results)}/{len(tickers)} successful")
-        
-    except Exception as e:
-        logger.error(f"Job {job_id} failed: {e}", exc_info=True)
-        job_store[job_id].update({
-            "status": "failed",
-            "completed_at": datetime.utcnow().isoformat(),
-            "error": str(e)
-        })
-
-
 @app.get("/api/v1/reports/status/{job_id}", response_model=JobStatusResponse, tags=["Reports"])
-async def get_job_status(job_id: str):
+async def get_job_status(job_id: str = PathParam(..., pattern=JOB_ID_PATTERN)):
     """
     Get the status of a report fetching job.
     
+    The job record is written by our own workers, so the response is built
+    without re-validation. Once a job has finished its serialized response is
+    cached and served as-is to subsequent polls.
+    
     Args:
         job_id: Unique job identifier returned from /fetch endpoint
     """
-    if job_id not in job_store:
-        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    cached = await load_status_response(app.state.redis, job_id)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
     
-    job = job_store[job_id]
+    job = await load_job(app.state.redis, job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
     
-    return JobStatusResponse(
+    content = JobStatusResponse.model_construct(
         job_id=job["job_id"],
         status=job["status"],
         created_at=job["created_at"],
@@ -240,30 +298,35 @@ async def get_job_status(job_id: str):
         processed=job["processed"],
         successful=job["successful"],
         failed=job["failed"],
-        results=job["results"]
-    )
+        results=[ReportResult.model_construct(**r) for r in job["results"]]
+    ).model_dump_json()
+    
+    # Finished jobs don't change anymore
+    if job["status"] in FINAL_JOB_STATUSES:
+        await cache_status_response(app.state.redis, job_id, content)
+    
+    return Response(content=content, media_type="application/json")
 
 
 @app.get("/api/v1/reports/download/{job_id}/{ticker}", tags=["Reports"])
-async def download_report(job_id: str, ticker: str):
+async def download_report(request: Request, ticker: str,
+                          job_id: str = PathParam(..., pattern=JOB_ID_PATTERN)):
     """
     Download a specific PDF report by job ID and ticker.
     
+    Responses carry ETag/Last-Modified headers; a request whose If-None-Match
+    matches the current ETag gets 304 Not Modified without the file body.
+    
     Args:
         job_id: Job identifier
         ticker: Company ticker symbol
     """
-    if job_id not in job_store:
-        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
-    
-    job = job_store[job_id]
-    
     # Find the report for this ticker
     ticker_upper = ticker.upper()
-    report = next(
-        (r for r in job["results"] if r["ticker"] == ticker_upper),
-        None
-    )
+    job_exists, report = await load_job_result(app.state.redis, job_id, ticker_upper)
+    
+    if not job_exists:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
     
     if not report:
         raise HTTPException(
@@ -273,31 +336,51 @@ async def download_report(job_id: str, ticker: str):
     
     pdf_path = Path(report["pdf_path"])
     
-    if not pdf_path.exists():
+    # Stat once (on the threadpool to keep the event loop free) and hand the
+    # result to FileResponse so it doesn't stat the file again
+    try:
+        stat_result = await run_in_threadpool(os.stat, pdf_path)
+    except FileNotFoundError:
         raise HTTPException(
             status_code=404,
             detail=f"PDF file not found: {report['pdf_path']}"
         )
     
-    return FileResponse(
+    response = FileResponse(
         path=pdf_path,
         filename=pdf_path.name,
-        media_type="application/pdf"
+        media_type="application/pdf",
+        stat_result=stat_result,
+        headers={"Cache-Control": PDF_CACHE_CONTROL}
     )
+    
+    etag = response.headers["etag"]
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(
+            status_code=304,
+            headers={"ETag": etag, "Cache-Control": PDF_CACHE_CONTROL}
+        )
+    
+    return response
 
 
 @app.get("/api/v1/companies", tags=["Companies"])
-async def list_supported_companies():
+def list_supported_companies():
     """List all supported companies with their tickers and CIKs."""
-    return {
-        "companies": [
-            {"ticker": ticker, "cik": cik}
-            for ticker, cik in TICKER_TO_CIK.items()
-        ],
-        "total": len(TICKER_TO_CIK)
-    }
+    return Response(content=_COMPANIES_JSON, media_type="application/json")
 
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # Job state lives in Redis, so the API can run one process per core.
+    # "auto" picks uvloop/httptools when installed (uvicorn[standard]).
+    uvicorn.run(
+        "src.api.main:app",
+        host="0.0.0.0",
+        port=8000,
+        workers=int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        loop="auto",
+        http="auto",
+        limit_concurrency=1000,
+        timeout_keep_alive=30
+    )
@@ -0,0 +1,71 @@
+"""
+Redis-backed SEC request rate limiter shared by all worker processes
+
+Every worker process throttles its own requests, but the SEC limit applies to
+all of them together. This limiter counts requests in a fixed one-second
+window stored in Redis, so any number of workers share a single budget.
+"""
+
+import time
+import logging
+
+import redis
+
+from src.sec10k_fetcher import SEC_MAX_REQUESTS_PER_SECOND
+
+logger = logging.getLogger(__name__)
+
+# Prefix of the per-second request counters (sec:requests:{unix second})
+SEC_REQUESTS_KEY_PREFIX = "sec:requests"
+
+# Counts a request in the current window (based on the Redis server clock, so
+# workers agree on window boundaries) and returns 0 if it fits the budget,
+# otherwise the microseconds until the next window starts.
+_ACQUIRE_SCRIPT = """
+local now = redis.call('TIME')
+local key = KEYS[1] .. ':' .. now[1]
+local count = redis.call('INCR', key)
+if count == 1 then
+    redis.call('EXPIRE', key, 2)
+end
+if count <= tonumber(ARGV[1]) then
+    return 0
+end
+return 1000000 - tonumber(now[2])
+"""
+
+
+class RedisRateLimiter:
+    """
+    Fixed-window rate limiter for SEC API requests.
+
+    acquire() is synchronous because the fetcher makes its requests from
+    worker threads.
+    """
+
+    def __init__(self, redis_url: str, max_requests_per_second: int = SEC_MAX_REQUESTS_PER_SECOND):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            redis_url: URL of the Redis server shared by the workers
+            max_requests_per_second: Request budget shared by all workers
+        """
+        self._redis = redis.Redis.from_url(redis_url)
+        self._acquire = self._redis.register_script(_ACQUIRE_SCRIPT)
+        self.max_requests_per_second = max_requests_per_second
+
+    def acquire(self) -> None:
+        """Block until a request may be sent to the SEC API."""
+        while True:
+            wait_us = self._acquire(
+                keys=[SEC_REQUESTS_KEY_PREFIX], args=[self.max_requests_per_second]
+            )
+            if not wait_us:
+                return
+            logger.debug(f"SEC request budget exhausted, waiting {wait_us / 1e6:.3f}s")
+            time.sleep(wait_us / 1e6)
+
+    def close(self) -> None:
+        """Close the Redis connection."""
+        self._redis.close()
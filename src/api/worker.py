@@ -0,0 +1,172 @@
+"""
+ARQ worker for the SEC 10-K Report Fetcher API
+
+Executes report fetching jobs enqueued by the API service and writes their
+progress to the Redis job store.
+
+Run one or more workers with:
+    arq src.api.worker.WorkerSettings
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from src.sec10k_fetcher import (
+    SEC10KFetcher,
+    SECRateLimitError,
+    create_render_pool,
+    TICKER_TO_CIK,
+    SEC_MAX_CONCURRENCY,
+    configure_logging,
+)
+from src.api.jobs import (
+    REDIS_URL,
+    REDIS_SETTINGS,
+    record_result,
+    finish_job,
+    get_cached_result,
+    cache_result,
+    set_sec_backoff,
+    get_sec_backoff,
+    job_timestamp,
+)
+from src.api.rate_limit import RedisRateLimiter
+
+logger = logging.getLogger(__name__)
+
+# Fetches currently running in this worker process, keyed by (ticker, output dir).
+# Concurrent jobs asking for the same report wait for the running fetch instead
+# of downloading and converting it again.
+_inflight: Dict[Tuple[str, str], "asyncio.Future"] = {}
+
+
+async def fetch_report(redis, fetcher: SEC10KFetcher, ticker: str, output_path: Path,
+                       semaphore: asyncio.Semaphore) -> Optional[Dict]:
+    """
+    Fetch the latest 10-K PDF for a company, reusing cached or in-flight work.
+
+    Args:
+        redis: Redis connection
+        fetcher: Fetcher used to process the company
+        ticker: Company ticker symbol
+        output_path: Directory to save the PDF file
+        semaphore: Semaphore bounding concurrent fetches
+
+    Returns:
+        Processing result dictionary or None if processing fails
+    """
+    cached = await get_cached_result(redis, ticker, output_path)
+    if cached:
+        logger.info(f"Using cached report for {ticker}: {cached['pdf_path']}")
+        return cached
+
+    inflight_key = (ticker, str(output_path.resolve()))
+    running = _inflight.get(inflight_key)
+    if running is not None:
+        return await asyncio.shield(running)
+
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    _inflight[inflight_key] = future
+
+    result = None
+    try:
+        async with semaphore:
+            # Don't keep calling the SEC API while it is rate limiting us
+            if await get_sec_backoff(redis):
+                logger.warning(f"SEC rate limit back-off active, skipping {ticker}")
+                return None
+            # The fetcher is synchronous; run it off the event loop
+            result = await loop.run_in_executor(
+                None, fetcher.process_company, ticker, TICKER_TO_CIK[ticker], output_path
+            )
+        if result:
+            await cache_result(redis, result, output_path)
+    except SECRateLimitError as e:
+        logger.error(f"Failed to process {ticker}: {e}")
+        await set_sec_backoff(redis, e.retry_after)
+    finally:
+        del _inflight[inflight_key]
+        future.set_result(result)
+    return result
+
+
+async def process_reports_job(ctx, job_id: str, tickers: List[str], output_dir: str):
+    """
+    Process a report fetching job.
+
+    Tickers are processed concurrently (bounded by SEC_MAX_CONCURRENCY across
+    all jobs of this worker) and each result is recorded as soon as it is
+    available so that the status endpoint reports progress while the job is
+    running.
+
+    Args:
+        ctx: ARQ worker context (holds the Redis connection, shared fetcher
+            and concurrency semaphore)
+        job_id: Unique job identifier
+        tickers: List of company tickers
+        output_dir: Output directory for PDFs
+    """
+    redis = ctx["redis"]
+
+    try:
+        logger.info(f"Starting job {job_id} for tickers: {tickers}")
+
+        output_path = Path(output_dir)
+        output_path.mkdir(parents=True, exist_ok=True)
+        fetcher = ctx["fetcher"]
+        semaphore = ctx["semaphore"]
+
+        async def fetch_one(ticker: str) -> bool:
+            result = await fetch_report(redis, fetcher, ticker, output_path, semaphore)
+            await record_result(redis, job_id, result)
+            return bool(result)
+
+        outcomes = await asyncio.gather(*(fetch_one(ticker) for ticker in tickers))
+        successful = sum(outcomes)
+
+        await finish_job(redis, job_id, "completed", job_timestamp())
+        logger.info(f"Completed job {job_id}: {successful}/{len(tickers)} successful")
+
+    except Exception as e:
+        logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+        await finish_job(redis, job_id, "failed", job_timestamp(), error=str(e))
+
+
+async def startup(ctx) -> None:
+    """Create the fetcher shared by all jobs run in this worker process."""
+    # ARQ only configures its own loggers; route the fetcher's logs through
+    # the same queued handlers as the API
+    configure_logging()
+    # Reusing one fetcher keeps SEC connections alive across jobs; the shared
+    # semaphore bounds the tickers processed at once across concurrent jobs
+    ctx["rate_limiter"] = RedisRateLimiter(REDIS_URL)
+    # PDFs are rendered in separate processes so conversions don't contend
+    # for this worker's GIL
+    ctx["render_pool"] = create_render_pool()
+    ctx["fetcher"] = SEC10KFetcher(
+        rate_limiter=ctx["rate_limiter"],
+        render_executor=ctx["render_pool"]
+    )
+    ctx["semaphore"] = asyncio.Semaphore(SEC_MAX_CONCURRENCY)
+
+
+async def shutdown(ctx) -> None:
+    """Close the shared fetcher, render pool and rate limiter."""
+    ctx["fetcher"].close()
+    ctx["render_pool"].shutdown()
+    ctx["rate_limiter"].close()
+
+
+class WorkerSettings:
+    """ARQ worker configuration."""
+    functions = [process_reports_job]
+    on_startup = startup
+    on_shutdown = shutdown
+    redis_settings = REDIS_SETTINGS
+    # Fetching and converting several 10-Ks can take a while
+    job_timeout = 3600
+    # Results are recorded incrementally, so a retried job would duplicate them
+    max_tries = 1
@@ -4,15 +4,42 @@ SEC 10-K Fetcher Module
 Core functionality for fetching SEC 10-K reports and converting to PDF.
 """
 
-from .fetcher import SEC10KFetcher, SECAPIError, PDFConversionError, fetch_10k_reports
-from .config import TICKER_TO_CIK, SEC_USER_AGENT, SEC_REQUEST_DELAY
+from .fetcher import (
+    SEC10KFetcher,
+    SECAPIError,
+    SECRateLimitError,
+    PDFConversionError,
+    fetch_10k_reports,
+    afetch_10k_reports,
+    create_render_pool,
+)
+from .logging_config import configure_logging
+from .config import (
+    TICKER_TO_CIK,
+    CIK_TO_TICKER,
+    TICKER_CIK_PAIRS,
+    VALID_TICKERS,
+    SEC_USER_AGENT,
+    SEC_REQUEST_DELAY,
+    SEC_MAX_REQUESTS_PER_SECOND,
+    SEC_MAX_CONCURRENCY,
+)
 
 __all__ = [
     "SEC10KFetcher",
     "SECAPIError",
+    "SECRateLimitError",
     "PDFConversionError",
     "fetch_10k_reports",
+    "afetch_10k_reports",
+    "create_render_pool",
+    "configure_logging",
     "TICKER_TO_CIK",
+    "CIK_TO_TICKER",
+    "TICKER_CIK_PAIRS",
+    "VALID_TICKERS",
     "SEC_USER_AGENT",
     "SEC_REQUEST_DELAY",
+    "SEC_MAX_REQUESTS_PER_SECOND",
+    "SEC_MAX_CONCURRENCY",
 ]
@@ -4,17 +4,50 @@ Configuration constants for SEC 10-K Fetcher
 Contains SEC API endpoints, rate limiting settings, and company mappings.
 """
 
+import os
+from pathlib import Path
+from types import MappingProxyType
+
 # SEC API Configuration
 SEC_SUBMISSIONS_TEMPLATE = "https://data.sec.gov/submissions/CIK{cik:0>10s}.json"
 SEC_ARCHIVE_BASE = "https://www.sec.gov/Archives/edgar/data"
 SEC_USER_AGENT = "Quartr Data Automation Team contact@quartr.com"
 
 # Rate limiting: SEC recommends no more than 10 requests per second
+SEC_MAX_REQUESTS_PER_SECOND = 10
 SEC_REQUEST_DELAY = 0.1  # 100ms between requests
 
+# Seconds to back off when the SEC API returns 429 without a usable Retry-After
+SEC_RETRY_AFTER_DEFAULT = 600
+
+# Maximum number of companies processed concurrently
+SEC_MAX_CONCURRENCY = 4
+
+# Images of a filing downloaded in parallel (still bound by the request rate)
+SEC_IMAGE_DOWNLOAD_WORKERS = 4
+
+# Keep-alive connections pooled per SEC host. Every concurrently processed
+# company downloads images from several threads, so the pool is sized to the
+# request rate rather than to the number of companies; more connections
+# couldn't be used without exceeding the rate limit.
+SEC_MAX_CONNECTIONS = SEC_MAX_REQUESTS_PER_SECOND
+
+# Processes rendering PDFs in parallel (PDF conversion is CPU-bound)
+PDF_RENDER_WORKERS = os.cpu_count() or 1
+
+# On-disk HTTP cache for SEC responses (set SEC10K_HTTP_CACHE to "" to disable)
+SEC_HTTP_CACHE_PATH = os.getenv("SEC10K_HTTP_CACHE", str(Path.home() / ".sec10k_cache"))
+
+# Seconds a cached submissions response is reused (submissions change at most daily)
+SEC_SUBMISSIONS_CACHE_TTL = 3600
+
+# (connect, read) timeouts in seconds for SEC requests; connecting should be
+# quick over pooled keep-alive connections, while large filings take longer
+SEC_REQUEST_TIMEOUT = (5, 30)
+
 # Company ticker to CIK mapping
 # CIKs (Central Index Keys) are required to fetch SEC filings
-TICKER_TO_CIK = {
+_TICKER_TO_CIK = {
     "AAPL": "0000320193",  # Apple Inc.
     "META": "0001326801",  # Meta Platforms Inc.
     "GOOGL": "0001652044",  # Alphabet Inc. (Class A)
@@ -22,3 +55,19 @@ TICKER_TO_CIK = {
     "NFLX": "0001065280",  # Netflix Inc.
     "GS": "0000886982",  # Goldman Sachs Group Inc.
 }
+
+# Read-only views so the shared mappings can't be modified at runtime
+TICKER_TO_CIK = MappingProxyType(_TICKER_TO_CIK)
+CIK_TO_TICKER = MappingProxyType({cik: ticker for ticker, cik in _TICKER_TO_CIK.items()})
+
+# (ticker, CIK) pairs of the supported companies, materialized once for code
+# that iterates over all of them
+TICKER_CIK_PAIRS = tuple(_TICKER_TO_CIK.items())
+
+# Submissions URLs of the supported companies, built once
+SUBMISSIONS_URL_BY_CIK = MappingProxyType({
+    cik: SEC_SUBMISSIONS_TEMPLATE.format(cik=cik) for cik in _TICKER_TO_CIK.values()
+})
+
+# Set of supported tickers for fast batch validation
+VALID_TICKERS = frozenset(TICKER_TO_CIK)
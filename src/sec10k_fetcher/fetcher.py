@@ -13,23 +13,51 @@ The implementation follows SEC API guidelines:
 """
 
 import os
-import json
+import io
+import atexit
+import html
+import mmap
+import base64
 import time
+import asyncio
 import logging
 import re
+import tempfile
+import threading
+import multiprocessing
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional, Set
-from datetime import datetime
+from typing import List, Dict, Mapping, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from requests_cache import CachedSession, DO_NOT_CACHE, NEVER_EXPIRE
 from weasyprint import HTML
+from weasyprint.text.fonts import FontConfiguration
+
+try:
+    # WeasyPrint >= 70 fetches resources through a reusable fetcher object;
+    # older versions use a plain function, so there is nothing to reuse
+    from weasyprint.urls import URLFetcher
+except ImportError:
+    URLFetcher = None
 
 from .config import (
     SEC_SUBMISSIONS_TEMPLATE,
     SEC_ARCHIVE_BASE,
     SEC_USER_AGENT,
     SEC_REQUEST_DELAY,
+    SEC_MAX_CONCURRENCY,
+    SEC_MAX_CONNECTIONS,
+    SEC_IMAGE_DOWNLOAD_WORKERS,
+    PDF_RENDER_WORKERS,
+    SEC_REQUEST_TIMEOUT,
+    SEC_RETRY_AFTER_DEFAULT,
+    SEC_HTTP_CACHE_PATH,
+    SEC_SUBMISSIONS_CACHE_TTL,
+    SUBMISSIONS_URL_BY_CIK,
     TICKER_TO_CIK,
 )
 
@@ -43,11 +71,467 @@ class SECAPIError(Exception):
     pass
 
 
+class SECRateLimitError(SECAPIError):
+    """Raised when the SEC API rejects a request with HTTP 429 (Too Many Requests)."""
+    
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
 class PDFConversionError(Exception):
     """Custom exception for PDF conversion errors."""
     pass
 
 
+# PDF engines supported by SEC10KFetcher
+PDF_ENGINES = ("weasyprint", "chromium")
+
+# Font configuration and URL fetchers (by User-Agent) reused by _render_pdf
+# calls in a render worker process
+_process_font_config = None
+_process_url_fetchers = {}
+
+# Per-thread headless Chromium browser of the chromium engine
+_chromium = threading.local()
+
+# Chunk and write buffer size used when streaming downloads to disk
+_DOWNLOAD_CHUNK_SIZE = 1 << 20
+
+# Write buffer size for rendered PDFs (multi-MB files in few write calls)
+_PDF_WRITE_BUFFER_SIZE = 1 << 20
+
+# Permissions of rendered PDFs (served by the API, possibly as another user)
+_PDF_FILE_MODE = 0o644
+
+# Suffix of the sidecar files storing the validators of downloaded filings
+_META_SUFFIX = ".meta.json"
+
+# How long SEC responses are kept in the HTTP cache (first matching rule wins).
+# Filed documents never change, but large primary documents are streamed to
+# disk rather than buffered into the cache; only their small images and file
+# manifests are kept.
+_HTTP_CACHE_EXPIRY = {
+    "data.sec.gov/submissions/": SEC_SUBMISSIONS_CACHE_TTL,
+    re.compile(
+        r"www\.sec\.gov/Archives/edgar/data/.+(?:\.(?:jpg|jpeg|png|gif|svg)|/index\.json)$",
+        re.IGNORECASE
+    ): NEVER_EXPIRE,
+    "*": DO_NOT_CACHE,
+}
+
+# MIME types of the image formats downloaded with HTML filings
+_IMAGE_MIME_TYPES = {
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+    ".gif": "image/gif",
+    ".svg": "image/svg+xml",
+}
+
+# Image references in HTML (img src and CSS url()), matched on the raw bytes:
+# the attribute or url( prefix (group 1) and the reference (group 2). Shared by
+# the download and inlining steps, so both agree on which references are images.
+_IMAGE_REF_RE = re.compile(
+    rb'''(src=["']|url\(["']?)([^"'()\s]*\.(?:jpg|jpeg|png|gif|svg))(?=["')\s>])''', re.IGNORECASE
+)
+
+
+def _find_local_image_refs(html_file: Path) -> List[str]:
+    """
+    Find the unique local image references of an HTML file, in document order.
+    
+    The file is scanned through a read-only memory map, so the document is
+    neither read into memory as a whole nor decoded.
+    
+    Args:
+        html_file: Path to the HTML file
+        
+    Returns:
+        Relative image paths (external URLs are skipped)
+    """
+    image_paths = {}
+    with open(html_file, "rb") as f:
+        # mmap can't map an empty file
+        if not os.fstat(f.fileno()).st_size:
+            return []
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as html_content:
+            for match in _IMAGE_REF_RE.finditer(html_content):
+                image_path = match.group(2).decode("utf-8", "ignore")
+                # Only download images in the same directory (not external URLs)
+                if not image_path.startswith("http") and not image_path.startswith("//"):
+                    image_paths[image_path] = None
+    return list(image_paths)
+
+
+def _inline_local_images(html: bytes, base_dir: Path) -> bytes:
+    """
+    Replace references to downloaded images with base64 data URIs.
+    
+    Inlined images are embedded directly by WeasyPrint instead of being fetched
+    one by one while rendering.
+    
+    Args:
+        html: Raw HTML document
+        base_dir: Directory containing the downloaded images
+        
+    Returns:
+        HTML document with local image references inlined
+    """
+    data_uris = {}
+    
+    def replace(match):
+        ref = match.group(2)
+        if ref.startswith((b"http", b"//")):
+            return match.group(0)
+        
+        if ref not in data_uris:
+            image_name = os.path.basename(urlparse(ref.decode("ascii", "ignore")).path)
+            image_path = base_dir / image_name
+            # A reference may name a file without an image suffix (e.g.
+            # img.php?f=logo.png), which is left for the PDF engine
+            mime_type = _IMAGE_MIME_TYPES.get(image_path.suffix.lower())
+            if image_name and mime_type and image_path.is_file():
+                data_uris[ref] = (
+                    f"data:{mime_type};base64,".encode("ascii")
+                    + base64.b64encode(image_path.read_bytes())
+                )
+            else:
+                data_uris[ref] = None
+        
+        data_uri = data_uris[ref]
+        return match.group(1) + data_uri if data_uri else match.group(0)
+    
+    return _IMAGE_REF_RE.sub(replace, html)
+
+
+def _txt_to_html(txt_content: str) -> str:
+    """Wrap a plain-text filing in a minimal HTML document (escaping its text)."""
+    return f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <style>
+            pre {{ 
+                font-family: 'Courier New', monospace; 
+                font-size: 10pt;
+                white-space: pre-wrap;
+                word-wrap: break-word;
+            }}
+            body {{ margin: 20px; }}
+        </style>
+    </head>
+    <body>
+        <pre>{html.escape(txt_content, quote=False)}</pre>
+    </body>
+    </html>
+    """
+
+
+def _chromium_browser():
+    """
+    Get the headless Chromium browser of the calling thread, launching it on
+    first use.
+    
+    Playwright's sync API objects can only be used from the thread that
+    created them, so each thread (or render process) keeps its own browser,
+    stopped by _close_chromium in that same thread.
+    """
+    browser = getattr(_chromium, "browser", None)
+    if browser is None:
+        try:
+            from playwright.sync_api import sync_playwright
+        except ImportError as e:
+            raise PDFConversionError(
+                "The chromium engine requires playwright "
+                "(pip install playwright && playwright install chromium)"
+            ) from e
+        _chromium.playwright = sync_playwright().start()
+        browser = _chromium.browser = _chromium.playwright.chromium.launch()
+        # Render processes run conversions in their main thread until the pool
+        # shuts them down; stop the browser when the process exits
+        if threading.current_thread() is threading.main_thread():
+            atexit.unregister(_close_chromium)
+            atexit.register(_close_chromium)
+    return browser
+
+
+def _close_chromium() -> None:
+    """Stop the headless Chromium browser of the calling thread, if it launched one."""
+    browser = getattr(_chromium, "browser", None)
+    if browser is None:
+        return
+    try:
+        browser.close()
+    finally:
+        _chromium.playwright.stop()
+        _chromium.browser = _chromium.playwright = None
+
+
+def _new_url_fetcher(user_agent: str = SEC_USER_AGENT):
+    """
+    Create a WeasyPrint URL fetcher for the resources of filings.
+    
+    The fetcher identifies itself with the given User-Agent, which SEC requires
+    for images that are still fetched remotely.
+    
+    Args:
+        user_agent: User-Agent header of the fetcher's requests
+        
+    Returns:
+        URL fetcher, or None to use WeasyPrint's default on versions without
+        reusable fetchers (before 70)
+    """
+    if URLFetcher is None:
+        return None
+    return URLFetcher(http_headers={"User-Agent": user_agent})
+
+
+def _render_pdf(input_file: Path, output_file: Path, engine: str = "weasyprint",
+                font_config: Optional[FontConfiguration] = None,
+                url_fetcher=None, user_agent: str = SEC_USER_AGENT) -> None:
+    """
+    Render an HTML or TXT filing to PDF.
+    
+    Module-level so that it can run in a separate process (see SEC10KFetcher's
+    render_executor). The PDF is written through a large buffer to a partial
+    file that is renamed once complete, so an interrupted conversion never
+    leaves a truncated PDF under the final name. Each conversion gets its own
+    partial file, since other processes (e.g. other API workers) may render
+    the same PDF at the same time.
+    
+    Args:
+        input_file: Path to input HTML/TXT file
+        output_file: Path for output PDF file
+        engine: PDF engine, one of PDF_ENGINES
+        font_config: WeasyPrint font configuration to reuse (defaults to one
+            kept per process)
+        url_fetcher: WeasyPrint URL fetcher to reuse (defaults to one kept per
+            process for user_agent)
+        user_agent: User-Agent of the default URL fetcher's requests
+    """
+    fd, partial_name = tempfile.mkstemp(
+        dir=output_file.parent, prefix=output_file.name, suffix=".part"
+    )
+    os.close(fd)
+    partial_file = Path(partial_name)
+    try:
+        with open(partial_file, "wb", buffering=_PDF_WRITE_BUFFER_SIZE) as target:
+            _write_pdf(input_file, target, engine, font_config, url_fetcher, user_agent)
+        # mkstemp creates the file readable by its owner only
+        os.chmod(partial_file, _PDF_FILE_MODE)
+        os.replace(partial_file, output_file)
+    except BaseException:
+        partial_file.unlink(missing_ok=True)
+        raise
+
+
+def _write_pdf(input_file: Path, target: io.BufferedWriter, engine: str,
+               font_config: Optional[FontConfiguration], url_fetcher,
+               user_agent: str) -> None:
+    """Render a filing to PDF into an open file (see _render_pdf)."""
+    is_txt = input_file.suffix.lower() == ".txt"
+    
+    if engine == "chromium":
+        page = _chromium_browser().new_page()
+        try:
+            if is_txt:
+                with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
+                    page.set_content(_txt_to_html(f.read()))
+            else:
+                # The browser loads the filing's images itself, in parallel
+                page.goto(input_file.resolve().as_uri())
+            target.write(page.pdf(format="Letter"))
+        finally:
+            page.close()
+        return
+    
+    global _process_font_config
+    if font_config is None:
+        if _process_font_config is None:
+            _process_font_config = FontConfiguration()
+        font_config = _process_font_config
+    if url_fetcher is None:
+        if user_agent not in _process_url_fetchers:
+            _process_url_fetchers[user_agent] = _new_url_fetcher(user_agent)
+        url_fetcher = _process_url_fetchers[user_agent]
+    # Without a reusable fetcher, HTML keeps its own default_url_fetcher
+    # (passing url_fetcher=None would replace it)
+    fetcher_args = {"url_fetcher": url_fetcher} if url_fetcher is not None else {}
+    
+    # WeasyPrint can handle HTML files
+    # For TXT files, we'll wrap them in basic HTML
+    if is_txt:
+        # Convert TXT to HTML by wrapping in pre tags
+        with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
+            html_content = _txt_to_html(f.read())
+        
+        HTML(
+            string=html_content, base_url=str(input_file), **fetcher_args
+        ).write_pdf(target, font_config=font_config)
+    else:
+        # Direct HTML to PDF conversion, with downloaded images inlined. The raw
+        # bytes are passed on so WeasyPrint still detects the document encoding.
+        html_content = _inline_local_images(input_file.read_bytes(), input_file.parent)
+        HTML(
+            file_obj=io.BytesIO(html_content), base_url=str(input_file), **fetcher_args
+        ).write_pdf(target, font_config=font_config)
+
+
+def create_render_pool(max_workers: int = PDF_RENDER_WORKERS) -> ProcessPoolExecutor:
+    """
+    Create a process pool for rendering PDFs in parallel.
+    
+    Worker processes are spawned rather than forked, since the parent runs
+    other threads (downloads, logging) whose locks a forked child would inherit.
+    
+    Args:
+        max_workers: Number of render processes
+        
+    Returns:
+        Process pool to pass as SEC10KFetcher's render_executor
+    """
+    return ProcessPoolExecutor(
+        max_workers=max_workers, mp_context=multiprocessing.get_context("spawn")
+    )
+
+
+def _conditional_headers(local_path: Path, meta_path: Path) -> Dict[str, str]:
+    """
+    Build the conditional request headers revalidating a downloaded file.
+    
+    Args:
+        local_path: Previously downloaded file
+        meta_path: Sidecar file with the validators of that download
+        
+    Returns:
+        If-None-Match/If-Modified-Since headers, or an empty dict if there is
+        no usable earlier download
+    """
+    if not local_path.is_file():
+        return {}
+    try:
+        meta = orjson.loads(meta_path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return {}
+    
+    headers = {}
+    if meta.get("etag"):
+        headers["If-None-Match"] = meta["etag"]
+    if meta.get("last_modified"):
+        headers["If-Modified-Since"] = meta["last_modified"]
+    return headers
+
+
+def _write_validators(meta_path: Path, response_headers: Mapping[str, str]) -> None:
+    """
+    Store the ETag/Last-Modified of a download in its sidecar file.
+    
+    Args:
+        meta_path: Sidecar file to write
+        response_headers: Headers of the download response
+    """
+    meta = {
+        "etag": response_headers.get("ETag"),
+        "last_modified": response_headers.get("Last-Modified"),
+    }
+    if any(meta.values()):
+        meta_path.write_bytes(orjson.dumps(meta))
+    else:
+        # Nothing to revalidate with, so don't keep validators of an older version
+        meta_path.unlink(missing_ok=True)
+
+
+def _is_nonempty_file(path: Path) -> bool:
+    """Check whether a file exists and is not empty."""
+    try:
+        return path.stat().st_size > 0
+    except FileNotFoundError:
+        return False
+
+
+def _parse_retry_after(value: Optional[str], default: int = SEC_RETRY_AFTER_DEFAULT) -> int:
+    """
+    Parse a Retry-After header given in seconds.
+    
+    Args:
+        value: Header value (may be missing or an HTTP date)
+        default: Delay in seconds to use when the value is not a number of seconds
+        
+    Returns:
+        Number of seconds to wait before retrying
+    """
+    try:
+        return max(int(value), 1)
+    except (TypeError, ValueError):
+        return default
+
+
+class _RateLimiter:
+    """
+    Thread-safe token bucket limiting the rate of SEC API requests.
+    
+    Unlike a fixed sleep before every request, time spent elsewhere (e.g.
+    converting a PDF) counts towards the delay, so a request only waits when
+    the previous one was less than 1/rate seconds ago.
+    """
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize the rate limiter.
+        
+        Args:
+            rate: Requests allowed per second
+            capacity: Maximum burst of requests after an idle period
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
+    
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.rate)
+            self._last = now
+            # Take the token now; a negative balance reserves a slot in the
+            # future, so concurrent callers wait their turn without holding the lock
+            self._tokens -= 1
+            wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait:
+            time.sleep(wait)
+
+
+class _RateLimitedAdapter(HTTPAdapter):
+    """
+    Transport adapter acquiring a rate limiter before every request it sends.
+    
+    Responses served from the HTTP cache never reach the transport adapter, so
+    only requests that actually go to the SEC count towards the request rate.
+    """
+    
+    def __init__(self, rate_limiter=None, **kwargs):
+        """
+        Initialize the adapter.
+        
+        Args:
+            rate_limiter: Limiter whose blocking acquire() is called before each
+                request, or None to send requests unthrottled
+            **kwargs: Connection pool options passed on to HTTPAdapter
+        """
+        self.rate_limiter = rate_limiter
+        super().__init__(**kwargs)
+    
+    def send(self, request, **kwargs):
+        """Send a request once the rate limiter allows it."""
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return super().send(request, **kwargs)
+
+
 class SEC10KFetcher:
     """
     Fetches 10-K reports from SEC EDGAR database and converts them to PDF.
@@ -59,72 +543,245 @@ class SEC10KFetcher:
     - Converting HTML/TXT to PDF format
     """
     
-    def __init__(self, user_agent: str = SEC_USER_AGENT, request_delay: float = SEC_REQUEST_DELAY):
+    def __init__(self, user_agent: str = SEC_USER_AGENT, request_delay: float = SEC_REQUEST_DELAY,
+                 max_connections: int = SEC_MAX_CONNECTIONS, rate_limiter=None,
+                 cache_path: Optional[str] = SEC_HTTP_CACHE_PATH,
+                 render_executor: Optional[Executor] = None, engine: str = "weasyprint",
+                 submissions_ttl: float = SEC_SUBMISSIONS_CACHE_TTL):
         """
         Initialize the SEC 10-K fetcher.
         
         Args:
             user_agent: User-Agent string for SEC API requests (required by SEC)
             request_delay: Delay in seconds between API requests to respect rate limits
+            max_connections: Keep-alive connections pooled per SEC host; size this
+                to the number of requests in flight at once (companies processed
+                concurrently times their image download threads)
+            rate_limiter: Optional limiter shared with other processes; its
+                blocking acquire() is called before every request sent to the
+                SEC (not for cached responses) instead of the local
+                request_delay token bucket
+            cache_path: SQLite file caching submissions and filing images across
+                runs, or None to disable the HTTP cache
+            render_executor: Optional executor (typically from
+                create_render_pool) that PDF conversions are submitted to;
+                conversions run in the calling thread if not given
+            engine: PDF engine, "weasyprint" or "chromium" (headless Chromium
+                via the optional playwright package; faster on large filings)
+            submissions_ttl: Seconds parsed submissions are kept in memory for
+                repeated lookups of the same company, or 0 to always fetch them
+            
+        Raises:
+            ValueError: If the PDF engine is not supported
         """
-        self.session = requests.Session()
+        if engine not in PDF_ENGINES:
+            raise ValueError(f"Unsupported PDF engine {engine!r}, expected one of {PDF_ENGINES}")
+        self.engine = engine
+
+        if cache_path:
+            self.session = CachedSession(
+                cache_path, backend="sqlite", wal=True, urls_expire_after=_HTTP_CACHE_EXPIRY
+            )
+        else:
+            self.session = requests.Session()
+        self.request_delay = request_delay
+        # One limiter for all requests of this fetcher (filings and images, from
+        # any thread) so they stay within the SEC request rate together
+        if rate_limiter is None and request_delay > 0:
+            rate_limiter = _RateLimiter(rate=1 / request_delay)
+        # Requests beyond the pool size wait for a pooled connection instead of
+        # opening extra ones that would be discarded afterwards. The limiter is
+        # applied by the adapter, below the HTTP cache.
+        self._adapter = _RateLimitedAdapter(
+            rate_limiter, pool_maxsize=max_connections, pool_block=True
+        )
+        self.session.mount("https://", self._adapter)
+        self.user_agent = user_agent
         self.session.headers.update({
             "User-Agent": user_agent,
             "Accept-Encoding": "gzip, deflate",
             "Host": "data.sec.gov"
         })
-        self.request_delay = request_delay
+        # Headers of requests to the filing archive, built once for all downloads
+        self._archive_headers = {
+            "Host": "www.sec.gov",
+            "Referer": "https://www.sec.gov/"
+        }
+        # Loading the system fonts is a slow part of every conversion, so each
+        # thread keeps its font configuration (and URL fetcher) for later
+        # conversions (Pango font maps must not be shared between threads)
+        self._thread_local = threading.local()
+        self.render_executor = render_executor
+        # Without a render executor, chromium conversions run on a thread of
+        # the fetcher's own, so that close() can stop the browser in the thread
+        # that launched it
+        self._chromium_executor = (
+            ThreadPoolExecutor(max_workers=1, thread_name_prefix="chromium")
+            if engine == "chromium" and render_executor is None else None
+        )
+        # Parsed submissions by CIK as (expiry time, data); an expired entry is
+        # replaced by the next fetch, so there is at most one entry per company
+        self.submissions_ttl = submissions_ttl
+        self._submissions_cache: Dict[str, Tuple[float, Dict]] = {}
+        self._submissions_lock = threading.Lock()
         logger.info("SEC10KFetcher initialized")
     
-    def _make_request(self, url: str, headers: Optional[Dict] = None) -> requests.Response:
+    @property
+    def rate_limiter(self):
+        """Limiter applied to the requests sent to the SEC, if any."""
+        return self._adapter.rate_limiter
+    
+    def _font_config(self) -> FontConfiguration:
+        """Get the WeasyPrint font configuration of the calling thread."""
+        font_config = getattr(self._thread_local, "font_config", None)
+        if font_config is None:
+            font_config = self._thread_local.font_config = FontConfiguration()
+        return font_config
+    
+    def _url_fetcher(self):
+        """Get the WeasyPrint URL fetcher of the calling thread."""
+        if not hasattr(self._thread_local, "url_fetcher"):
+            self._thread_local.url_fetcher = _new_url_fetcher(self.user_agent)
+        return self._thread_local.url_fetcher
+    
+    def close(self) -> None:
+        """Close the underlying HTTP session, its pooled connections and the fetcher's browser."""
+        self.session.close()
+        if self._chromium_executor is not None:
+            self._chromium_executor.submit(_close_chromium).result()
+            self._chromium_executor.shutdown()
+            self._chromium_executor = None
+    
+    def _make_request(self, url: str, headers: Optional[Dict] = None,
+                      stream: bool = False) -> requests.Response:
         """
         Make an HTTP request with proper headers and rate limiting.
         
         Args:
             url: URL to request
-            headers: Optional additional headers
+            headers: Optional headers overriding the session headers
+            stream: Don't read the response body up front (the caller must
+                consume or close the response)
             
         Returns:
             Response object
             
         Raises:
+            SECRateLimitError: If the SEC API responds with HTTP 429
             SECAPIError: If the request fails
         """
-        request_headers = self.session.headers.copy()
-        if headers:
-            request_headers.update(headers)
-        
         try:
-            time.sleep(self.request_delay)  # Rate limiting
-            response = self.session.get(url, headers=request_headers, timeout=30)
-            response.raise_for_status()
+            # Per-request headers are merged over the session headers by
+            # requests; the session's adapter applies the rate limiter to
+            # requests that aren't served from the HTTP cache
+            response = self.session.get(
+                url, headers=headers, timeout=SEC_REQUEST_TIMEOUT, stream=stream
+            )
+            try:
+                if response.status_code == 429:
+                    retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+                    logger.error(f"SEC rate limit exceeded for URL {url}, retry after {retry_after}s")
+                    raise SECRateLimitError(
+                        f"SEC API rate limit exceeded, retry after {retry_after}s", retry_after
+                    )
+                response.raise_for_status()
+            except Exception:
+                # Release the connection of an unread streamed response
+                response.close()
+                raise
             return response
         except requests.exceptions.RequestException as e:
             logger.error(f"Request failed for URL {url}: {e}")
             raise SECAPIError(f"Failed to fetch data from SEC API: {e}") from e
     
+    def _download_to_file(self, url: str, local_path: Path, headers: Optional[Dict] = None,
+                          conditional: bool = False) -> bool:
+        """
+        Stream a response body to a file without holding it in memory.
+        
+        Args:
+            url: URL to download
+            local_path: File to write
+            headers: Optional additional headers
+            conditional: Revalidate an earlier download of the file with the
+                ETag/Last-Modified stored next to it, keeping the file as-is
+                if the server responds 304 Not Modified
+            
+        Returns:
+            True if the file was written, False if the existing file was reused
+            
+        Raises:
+            SECRateLimitError: If the SEC API responds with HTTP 429
+            SECAPIError: If the request fails
+            OSError: If the file cannot be written
+        """
+        meta_path = local_path.with_name(local_path.name + _META_SUFFIX)
+        if conditional:
+            headers = {**(headers or {}), **_conditional_headers(local_path, meta_path)}
+        
+        response = self._make_request(url, headers=headers, stream=True)
+        try:
+            if response.status_code == 304:
+                logger.debug(f"Not modified, reusing {local_path}")
+                return False
+            with open(local_path, "wb", buffering=_DOWNLOAD_CHUNK_SIZE) as f:
+                for chunk in response.iter_content(chunk_size=_DOWNLOAD_CHUNK_SIZE):
+                    f.write(chunk)
+        except BaseException:
+            # Don't leave a truncated file behind to be mistaken for a download
+            local_path.unlink(missing_ok=True)
+            raise
+        finally:
+            response.close()
+        
+        if conditional:
+            _write_validators(meta_path, response.headers)
+        return True
+    
     def get_company_submissions(self, cik: str) -> Dict:
         """
         Fetch company submission metadata from SEC API.
         
+        Parsed submissions are kept in memory for submissions_ttl seconds, so
+        repeated lookups (e.g. by later jobs of an API worker) neither request
+        nor parse them again.
+        
         Args:
             cik: Company Central Index Key (10-digit zero-padded string)
             
         Returns:
-            Dictionary containing company submission metadata
+            Dictionary containing company submission metadata (shared with
+            other callers, so it must not be modified)
             
         Raises:
             SECAPIError: If the API request fails
         """
-        url = SEC_SUBMISSIONS_TEMPLATE.format(cik=cik)
+        if self.submissions_ttl <= 0:
+            return self._fetch_company_submissions(cik)
+        
+        with self._submissions_lock:
+            cached = self._submissions_cache.get(cik)
+        if cached is not None and cached[0] > time.monotonic():
+            return cached[1]
+        
+        # Fetched without holding the lock, so lookups of other companies
+        # don't wait for this request
+        data = self._fetch_company_submissions(cik)
+        with self._submissions_lock:
+            self._submissions_cache[cik] = (time.monotonic() + self.submissions_ttl, data)
+        return data
+    
+    def _fetch_company_submissions(self, cik: str) -> Dict:
+        """Request and parse company submissions (see get_company_submissions)."""
+        url = SUBMISSIONS_URL_BY_CIK.get(cik) or SEC_SUBMISSIONS_TEMPLATE.format(cik=cik)
         logger.debug(f"Fetching submissions for CIK {cik}")
         
         try:
             response = self._make_request(url)
-            data = response.json()
+            data = orjson.loads(response.content)
             logger.info(f"Successfully fetched submissions for CIK {cik}")
             return data
-        except json.JSONDecodeError as e:
+        except orjson.JSONDecodeError as e:
             logger.error(f"Failed to parse JSON response for CIK {cik}: {e}")
             raise SECAPIError(f"Invalid JSON response from SEC API: {e}") from e
     
@@ -151,30 +808,35 @@ class SEC10KFetcher:
             logger.warning("Incomplete filing data in submissions")
             return None
         
-        latest_10k = None
-        latest_date = None
-        
-        # Iterate through filings to find the latest 10-K (excluding amendments)
+        # The dates have a fixed YYYY-MM-DD layout, so they are compared as
+        # YYYYMMDD integers in a single pass over the filings (excluding 10-K/A
+        # amendments) without parsing them into dates
+        latest_index = None
+        latest_key = -1
         for i, form_type in enumerate(form_types):
-            if form_type == "10-K":  # Exclude 10-K/A amendments
-                filing_date = filing_dates[i]
-                accession_number = accession_numbers[i]
-                primary_document = primary_documents[i]
-                
-                # Parse date for comparison
-                try:
-                    date_obj = datetime.strptime(filing_date, "%Y-%m-%d")
-                    if latest_date is None or date_obj > latest_date:
-                        latest_date = date_obj
-                        latest_10k = {
-                            "formType": form_type,
-                            "accessionNumber": accession_number,
-                            "filingDate": filing_date,
-                            "primaryDocument": primary_document
-                        }
-                except ValueError as e:
-                    logger.warning(f"Invalid date format {filing_date}: {e}")
-                    continue
+            if form_type != "10-K":
+                continue
+            filing_date = filing_dates[i]
+            try:
+                if len(filing_date) != 10:
+                    raise ValueError(filing_date)
+                key = (int(filing_date[:4]) * 10000 + int(filing_date[5:7]) * 100
+                       + int(filing_date[8:10]))
+            except ValueError:
+                logger.warning(f"Invalid date format {filing_date}")
+                continue
+            if key > latest_key:
+                latest_index, latest_key = i, key
+        
+        latest_10k = None
+        if latest_index is not None:
+            i = latest_index
+            latest_10k = {
+                "formType": form_types[i],
+                "accessionNumber": accession_numbers[i],
+                "filingDate": filing_dates[i],
+                "primaryDocument": primary_documents[i]
+            }
         
         if latest_10k:
             logger.info(
@@ -197,6 +859,9 @@ class SEC10KFetcher:
             
         Returns:
             Local filename if successful, None otherwise
+            
+        Raises:
+            SECRateLimitError: If the SEC API responds with HTTP 429
         """
         try:
             # Resolve relative URLs
@@ -214,26 +879,53 @@ class SEC10KFetcher:
             if local_image_path.exists():
                 return image_filename
             
-            archive_headers = {
-                "Host": "www.sec.gov",
-                "Referer": "https://www.sec.gov/"
-            }
-            response = self._make_request(image_url, headers=archive_headers)
-            
-            with open(local_image_path, "wb") as f:
-                f.write(response.content)
+            self._download_to_file(image_url, local_image_path, headers=self._archive_headers)
             
             logger.debug(f"Downloaded image: {image_filename}")
             return image_filename
             
+        except SECRateLimitError:
+            raise
         except Exception as e:
             logger.warning(f"Failed to download image {image_url}: {e}")
             return None
     
+    def _list_filing_images(self, base_url: str) -> Optional[Set[str]]:
+        """
+        List the image files of a filing from its index.json manifest.
+        
+        Args:
+            base_url: Archive URL of the filing directory (with trailing slash)
+            
+        Returns:
+            Set of image filenames in the filing, or None if the manifest
+            could not be fetched
+            
+        Raises:
+            SECRateLimitError: If the SEC API responds with HTTP 429
+        """
+        try:
+            response = self._make_request(f"{base_url}index.json", headers=self._archive_headers)
+            items = orjson.loads(response.content)["directory"]["item"]
+            return {
+                item["name"] for item in items
+                if os.path.splitext(item["name"])[1].lower() in _IMAGE_MIME_TYPES
+            }
+        except SECRateLimitError:
+            raise
+        except (SECAPIError, orjson.JSONDecodeError, KeyError, TypeError) as e:
+            logger.debug(f"No usable filing index at {base_url}: {e}")
+            return None
+    
     def _download_html_images(self, html_file: Path, cik: str, accession_number: str) -> Set[str]:
         """
         Download all images referenced in an HTML filing.
         
+        Images are downloaded here, through the fetcher's session and rate
+        limiter, rather than fetched by the PDF engine while rendering: render
+        processes don't share the rate limiter, and requests they sent on their
+        own would push the batch over the SEC request rate.
+        
         Args:
             html_file: Path to the HTML file
             cik: Company Central Index Key
@@ -241,36 +933,40 @@ class SEC10KFetcher:
             
         Returns:
             Set of downloaded image filenames
+            
+        Raises:
+            SECRateLimitError: If the SEC API responds with HTTP 429, so the
+                batch backs off instead of rendering the filing without images
         """
         if html_file.suffix.lower() != ".html" and html_file.suffix.lower() != ".htm":
             return set()
         
         try:
-            with open(html_file, "r", encoding="utf-8", errors="ignore") as f:
-                html_content = f.read()
-            
-            # Extract image references (img src and CSS background-image)
-            # Match common patterns: src="filename.jpg", src='filename.jpg', src=filename.jpg
-            image_patterns = [
-                r'src=["\']([^"\']*\.(jpg|jpeg|png|gif|svg))["\']',
-                r'background-image:\s*url\(["\']?([^"\']*\.(jpg|jpeg|png|gif|svg))["\']?\)',
-            ]
-            
             accession_no_hyphens = accession_number.replace("-", "")
             base_url = f"{SEC_ARCHIVE_BASE}/{int(cik)}/{accession_no_hyphens}/"
             output_dir = html_file.parent
             
-            downloaded_images = set()
+            # Collect unique references first so repeated images (e.g. logos)
+            # are fetched only once
+            image_paths = _find_local_image_refs(html_file)
+            
+            # Only request images that are actually part of the filing
+            if image_paths:
+                filing_images = self._list_filing_images(base_url)
+                if filing_images is not None:
+                    image_paths = [
+                        image_path for image_path in image_paths
+                        if os.path.basename(urlparse(image_path).path) in filing_images
+                    ]
             
-            for pattern in image_patterns:
-                matches = re.finditer(pattern, html_content, re.IGNORECASE)
-                for match in matches:
-                    image_path = match.group(1)
-                    # Only download images in the same directory (not external URLs)
-                    if not image_path.startswith("http") and not image_path.startswith("//"):
-                        local_filename = self._download_image(image_path, output_dir, base_url)
-                        if local_filename:
-                            downloaded_images.add(local_filename)
+            # Download in parallel; the shared rate limiter keeps the requests
+            # within the SEC request rate
+            with ThreadPoolExecutor(max_workers=SEC_IMAGE_DOWNLOAD_WORKERS) as executor:
+                local_filenames = executor.map(
+                    lambda image_path: self._download_image(image_path, output_dir, base_url),
+                    image_paths
+                )
+                downloaded_images = {filename for filename in local_filenames if filename}
             
             if downloaded_images:
                 logger.info(f"Downloaded {len(downloaded_images)} images for HTML filing")
@@ -279,12 +975,14 @@ class SEC10KFetcher:
             
             return downloaded_images
             
+        except SECRateLimitError:
+            raise
         except Exception as e:
             logger.warning(f"Failed to extract/download images from HTML: {e}")
             return set()
     
     def download_filing(self, cik: str, accession_number: str, document_name: str, 
-                       output_dir: Path) -> Path:
+                       output_dir: Path, revalidate: bool = False) -> Path:
         """
         Download a filing document from SEC archives.
         Also downloads referenced images if the filing is HTML.
@@ -294,6 +992,8 @@ class SEC10KFetcher:
             accession_number: Filing accession number (format: 0000000000-00-000000)
             document_name: Name of the primary document file
             output_dir: Directory to save the downloaded file
+            revalidate: For a persistent output_dir, keep the filing's validators
+                (*.meta.json) and only revalidate a copy downloaded there earlier
             
         Returns:
             Path to the downloaded file
@@ -309,21 +1009,16 @@ class SEC10KFetcher:
         logger.debug(f"Downloading filing from {url}")
         
         try:
-            # Update headers for archive request
-            archive_headers = {
-                "Host": "www.sec.gov",
-                "Referer": "https://www.sec.gov/"
-            }
-            response = self._make_request(url, headers=archive_headers)
-            
             # Save file
             output_dir.mkdir(parents=True, exist_ok=True)
             local_file = output_dir / document_name
             
-            with open(local_file, "wb") as f:
-                f.write(response.content)
-            
-            logger.info(f"Downloaded filing to {local_file}")
+            if self._download_to_file(
+                url, local_file, headers=self._archive_headers, conditional=revalidate
+            ):
+                logger.info(f"Downloaded filing to {local_file}")
+            else:
+                logger.info(f"Filing not modified, reusing {local_file}")
             
             # Download referenced images if HTML file
             if local_file.suffix.lower() in [".html", ".htm"]:
@@ -331,6 +1026,8 @@ class SEC10KFetcher:
             
             return local_file
             
+        except SECRateLimitError:
+            raise
         except Exception as e:
             logger.error(f"Failed to download filing: {e}")
             raise SECAPIError(f"Failed to download filing document: {e}") from e
@@ -352,44 +1049,22 @@ class SEC10KFetcher:
         logger.debug(f"Converting {input_file} to PDF: {output_file}")
         
         try:
-            # WeasyPrint can handle HTML files
-            # For TXT files, we'll wrap them in basic HTML
-            if input_file.suffix.lower() == ".txt":
-                # Convert TXT to HTML by wrapping in pre tags
-                with open(input_file, "r", encoding="utf-8", errors="ignore") as f:
-                    txt_content = f.read()
-                
-                html_content = f"""
-                <!DOCTYPE html>
-                <html>
-                <head>
-                    <meta charset="UTF-8">
-                    <style>
-                        pre {{ 
-                            font-family: 'Courier New', monospace; 
-                            font-size: 10pt;
-                            white-space: pre-wrap;
-                            word-wrap: break-word;
-                        }}
-                        body {{ margin: 20px; }}
-                    </style>
-                </head>
-                <body>
-                    <pre>{txt_content}</pre>
-                </body>
-                </html>
-                """
-                
-                # Write temporary HTML file
-                temp_html = input_file.with_suffix(".html")
-                with open(temp_html, "w", encoding="utf-8") as f:
-                    f.write(html_content)
-                
-                HTML(filename=str(temp_html)).write_pdf(str(output_file))
-                temp_html.unlink()  # Clean up temporary HTML file
+            if self.render_executor is not None:
+                # WeasyPrint is CPU-bound; render in another process so
+                # conversions of different companies run in parallel
+                self.render_executor.submit(
+                    _render_pdf, input_file, output_file, self.engine,
+                    user_agent=self.user_agent
+                ).result()
+            elif self.engine == "weasyprint":
+                _render_pdf(
+                    input_file, output_file, self.engine, self._font_config(), self._url_fetcher(),
+                    user_agent=self.user_agent
+                )
             else:
-                # Direct HTML to PDF conversion
-                HTML(filename=str(input_file)).write_pdf(str(output_file))
+                self._chromium_executor.submit(
+                    _render_pdf, input_file, output_file, self.engine
+                ).result()
             
             logger.info(f"Successfully converted to PDF: {output_file}")
             return output_file
@@ -410,6 +1085,10 @@ class SEC10KFetcher:
         Returns:
             Dictionary with processing results (ticker, cik, filing_date, pdf_path)
             or None if processing fails
+            
+        Raises:
+            SECRateLimitError: If the SEC API rate limit is exceeded, so callers
+                can back off instead of moving on to the next company
         """
         logger.info(f"Processing {ticker} (CIK: {cik})")
         
@@ -423,25 +1102,8 @@ class SEC10KFetcher:
                 logger.warning(f"No 10-K found for {ticker}")
                 return None
             
-            # Step 3: Download filing
-            temp_dir = output_dir / "temp"
-            downloaded_file = self.download_filing(
-                cik=cik,
-                accession_number=latest_10k["accessionNumber"],
-                document_name=latest_10k["primaryDocument"],
-                output_dir=temp_dir
-            )
-            
-            # Step 4: Convert to PDF
             pdf_filename = f"{ticker}_{latest_10k['accessionNumber']}_{latest_10k['filingDate']}.pdf"
             pdf_path = output_dir / pdf_filename
-            
-            self.convert_to_pdf(downloaded_file, pdf_path)
-            
-            # Clean up downloaded file (if it exists)
-            if downloaded_file.exists():
-                downloaded_file.unlink()
-            
             result = {
                 "ticker": ticker,
                 "cik": cik,
@@ -450,9 +1112,34 @@ class SEC10KFetcher:
                 "pdf_path": str(pdf_path)
             }
             
+            # The PDF name encodes the accession number, so an existing PDF
+            # already is the latest 10-K
+            if _is_nonempty_file(pdf_path):
+                logger.info(f"Skipping {ticker}, PDF already exists (cached): {pdf_path}")
+                return result
+            
+            # The filing and its images are only needed for the conversion;
+            # each company gets its own directory, removed afterwards
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(prefix=f"{ticker}_", dir=output_dir) as td:
+                temp_dir = Path(td)
+                
+                # Step 3: Download filing
+                downloaded_file = self.download_filing(
+                    cik=cik,
+                    accession_number=latest_10k["accessionNumber"],
+                    document_name=latest_10k["primaryDocument"],
+                    output_dir=temp_dir
+                )
+                
+                # Step 4: Convert to PDF
+                self.convert_to_pdf(downloaded_file, pdf_path)
+            
             logger.info(f"Successfully processed {ticker}: {result['pdf_path']}")
             return result
             
+        except SECRateLimitError:
+            raise
         except (SECAPIError, PDFConversionError) as e:
             logger.error(f"Failed to process {ticker}: {e}")
             return None
@@ -461,21 +1148,50 @@ class SEC10KFetcher:
             return None
 
 
+def _resolve_tickers(tickers: List[str], cik_map: Mapping[str, str]) -> List[Tuple[str, str]]:
+    """
+    Normalize and validate tickers in a single pass before dispatching work.
+    
+    Args:
+        tickers: Company stock ticker symbols (any case, may repeat)
+        cik_map: Mapping of upper-case tickers to CIKs
+        
+    Returns:
+        (ticker, cik) pairs of the known tickers, each once, in the given order
+    """
+    requested = dict.fromkeys(ticker.upper() for ticker in tickers)
+    unknown = [ticker for ticker in requested if ticker not in cik_map]
+    if unknown:
+        logger.warning(f"No CIK mapping found for tickers {unknown}, skipping")
+    return [(ticker, cik_map[ticker]) for ticker in requested if ticker in cik_map]
+
+
 def fetch_10k_reports(
     tickers: List[str],
     output_dir: str = "./output_pdfs",
-    cik_map: Optional[Dict[str, str]] = None
+    cik_map: Optional[Dict[str, str]] = None,
+    max_concurrency: int = SEC_MAX_CONCURRENCY,
+    cache_path: Optional[str] = SEC_HTTP_CACHE_PATH
 ) -> List[Dict]:
     """
     Fetch latest 10-K reports for a list of company tickers.
     
+    Companies are processed in a thread pool, at most max_concurrency at a time,
+    sharing a single fetcher so that the SEC rate limit applies to the batch as
+    a whole. PDFs are rendered in a separate process pool, so a company's
+    conversion overlaps with the downloads of the others.
+    
     Args:
         tickers: List of company stock ticker symbols
         output_dir: Directory to save PDF files
         cik_map: Optional dictionary mapping tickers to CIKs (defaults to built-in map)
+        max_concurrency: Maximum number of companies processed at the same time
+        cache_path: HTTP cache of the batch's fetcher (see SEC10KFetcher), or
+            None to disable it
         
     Returns:
-        List of dictionaries containing processing results for each company
+        List of dictionaries containing processing results for each company,
+        in the order of the given tickers
     """
     if cik_map is None:
         cik_map = TICKER_TO_CIK
@@ -483,20 +1199,90 @@ def fetch_10k_reports(
     output_path = Path(output_dir)
     output_path.mkdir(parents=True, exist_ok=True)
     
-    fetcher = SEC10KFetcher()
-    results = []
+    # Each company is processed once even if listed repeatedly
+    companies = _resolve_tickers(tickers, cik_map)
     
-    for ticker in tickers:
-        ticker_upper = ticker.upper()
-        cik = cik_map.get(ticker_upper)
-        
-        if not cik:
-            logger.warning(f"No CIK mapping found for ticker {ticker_upper}, skipping")
+    with create_render_pool() as render_pool:
+        fetcher = SEC10KFetcher(cache_path=cache_path, render_executor=render_pool)
+        try:
+            with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+                futures = [
+                    executor.submit(fetcher.process_company, ticker, cik, output_path)
+                    for ticker, cik in companies
+                ]
+        finally:
+            fetcher.close()
+    
+    results = []
+    for (ticker, _), future in zip(companies, futures):
+        try:
+            result = future.result()
+        except SECRateLimitError as e:
+            logger.error(f"Failed to process {ticker}: {e}")
             continue
-        
-        result = fetcher.process_company(ticker_upper, cik, output_path)
         if result:
             results.append(result)
     
     logger.info(f"Processing complete. {len(results)}/{len(tickers)} companies processed successfully")
     return results
+
+
+async def afetch_10k_reports(
+    tickers: List[str],
+    output_dir: str = "./output_pdfs",
+    cik_map: Optional[Dict[str, str]] = None,
+    max_concurrency: int = SEC_MAX_CONCURRENCY,
+    cache_path: Optional[str] = SEC_HTTP_CACHE_PATH
+) -> List[Dict]:
+    """
+    Fetch latest 10-K reports for a list of company tickers concurrently.
+    
+    Async variant of fetch_10k_reports. Companies are processed in worker threads,
+    at most max_concurrency at a time, sharing a single fetcher so that the SEC
+    rate limit applies to the batch as a whole. PDFs are rendered in a separate
+    process pool.
+    
+    Args:
+        tickers: List of company stock ticker symbols
+        output_dir: Directory to save PDF files
+        cik_map: Optional dictionary mapping tickers to CIKs (defaults to built-in map)
+        max_concurrency: Maximum number of companies processed at the same time
+        cache_path: HTTP cache of the batch's fetcher (see SEC10KFetcher), or
+            None to disable it
+        
+    Returns:
+        List of dictionaries containing processing results for each company
+    """
+    if cik_map is None:
+        cik_map = TICKER_TO_CIK
+    
+    output_path = Path(output_dir)
+    output_path.mkdir(parents=True, exist_ok=True)
+    
+    semaphore = asyncio.Semaphore(max_concurrency)
+    loop = asyncio.get_running_loop()
+    
+    with create_render_pool() as render_pool:
+        # One fetcher (and connection pool) for the whole batch
+        fetcher = SEC10KFetcher(cache_path=cache_path, render_executor=render_pool)
+        
+        async def fetch_one(ticker: str, cik: str) -> Optional[Dict]:
+            try:
+                async with semaphore:
+                    return await loop.run_in_executor(
+                        None, fetcher.process_company, ticker, cik, output_path
+                    )
+            except SECRateLimitError as e:
+                logger.error(f"Failed to process {ticker}: {e}")
+                return None
+        
+        try:
+            outcomes = await asyncio.gather(
+                *(fetch_one(ticker, cik) for ticker, cik in _resolve_tickers(tickers, cik_map))
+            )
+        finally:
+            fetcher.close()
+    results = [result for result in outcomes if result]
+    
+    logger.info(f"Processing complete. {len(results)}/{len(tickers)} companies processed successfully")
+    return results
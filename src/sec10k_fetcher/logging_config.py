@@ -0,0 +1,57 @@
+"""
+Logging setup for SEC 10-K Fetcher entry points
+
+Log records are handed to a queue and written by a background listener thread,
+so logging calls on the fetch path never block on file or console I/O.
+"""
+
+import atexit
+import logging
+import queue
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+LOG_FORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+
+# Third-party loggers that are too chatty at INFO level during concurrent fetches
+_QUIET_LOGGERS = ("urllib3",)
+
+
+def configure_logging(*handlers: logging.Handler, level: int = logging.INFO) -> Optional[QueueListener]:
+    """
+    Configure root logging through a non-blocking queue.
+
+    Like logging.basicConfig, this does nothing if the root logger already has
+    handlers.
+
+    Args:
+        handlers: Handlers that write the log records (defaults to a StreamHandler)
+        level: Root logger level
+
+    Returns:
+        The started QueueListener, or None if logging was already configured
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    if not handlers:
+        handlers = (logging.StreamHandler(),)
+
+    formatter = logging.Formatter(LOG_FORMAT)
+    for handler in handlers:
+        handler.setFormatter(formatter)
+
+    log_queue = queue.SimpleQueue()
+    root.addHandler(QueueHandler(log_queue))
+    root.setLevel(level)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    # Flush queued records on interpreter exit
+    atexit.register(listener.stop)
+
+    for name in _QUIET_LOGGERS:
+        logging.getLogger(name).setLevel(logging.WARNING)
+
+    return listener
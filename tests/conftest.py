@@ -0,0 +1,25 @@
+"""
+Shared pytest configuration for the SEC 10-K Fetcher tests
+
+Tests marked slow (real downloads and PDF rendering) are skipped unless
+pytest is run with --run-slow.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Add the --run-slow command line option."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="run tests marked slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+    skip_slow = pytest.mark.skip(reason="slow test, use --run-slow to run it")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
@@ -12,8 +12,10 @@ import pytest
 import sys
 from pathlib import Path
 
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+# Add src directory to path for imports (once, however often this is imported)
+_ROOT_DIR = str(Path(__file__).parent.parent.parent)
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
 
 from src.sec10k_fetcher import SEC10KFetcher, TICKER_TO_CIK
 
@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the SEC 10-K Fetcher unit tests
+
+Unit tests never render PDFs, so WeasyPrint (slow to import, and dependent
+on system libraries) is replaced by mocks before the fetcher is imported.
+"""
+
+import os
+import sys
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+# Add the repository root to the path for `src` imports, once per session
+_ROOT_DIR = str(Path(__file__).resolve().parents[2])
+if _ROOT_DIR not in sys.path:
+    sys.path.insert(0, _ROOT_DIR)
+
+# Keep the API's admission limit counters in memory rather than in Redis
+os.environ.setdefault("RATE_LIMIT_STORAGE_URI", "memory://")
+
+# Stand-ins for the WeasyPrint modules imported by the fetcher. A WeasyPrint
+# that is already imported (e.g. by integration tests collected earlier in
+# the same session) is left in place; HTML is patched per test either way.
+if "weasyprint" not in sys.modules:
+    for _module in ("weasyprint", "weasyprint.text", "weasyprint.text.fonts", "weasyprint.urls"):
+        sys.modules[_module] = MagicMock()
+
+
+@pytest.fixture(autouse=True)
+def mock_html_class():
+    """Replace WeasyPrint's HTML class in the fetcher for every test."""
+    with patch("src.sec10k_fetcher.fetcher.HTML") as mock_html:
+        yield mock_html
@@ -0,0 +1,234 @@
+"""
+Unit tests for the SEC 10-K Fetcher API service and worker
+
+Tests cover:
+- Upstream SEC rate limits surfaced as 429 responses
+- Conditional PDF downloads (ETag/304)
+- Job ID validation
+- Job status responses, built from and cached in the job store
+- Deduplication of concurrent fetches in the worker
+
+Redis is never contacted: the ARQ pool is either a mock, with the job store
+functions used by a test patched where the API/worker imported them, or an
+in-memory fakeredis server.
+"""
+
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, MagicMock, Mock, patch
+
+import fakeredis
+from fakeredis import aioredis
+from fastapi.testclient import TestClient
+
+# The repository root is put on sys.path by conftest.py
+from src.sec10k_fetcher import SECRateLimitError
+from src.api.main import app
+from src.api.jobs import create_job, record_result, finish_job, job_key, response_key
+from src.api.worker import fetch_report
+
+_JOB_ID = "0123456789abcdef0123456789abcdef"
+
+_RESULT = {
+    "ticker": "AAPL",
+    "cik": "0000320193",
+    "filing_date": "2025-10-31",
+    "accession_number": "0000320193-25-000079",
+    "pdf_path": "AAPL_0000320193-25-000079_2025-10-31.pdf"
+}
+
+
+@pytest.fixture
+def redis():
+    """Stand-in for the ArqRedis pool the API opens on startup."""
+    redis = MagicMock()
+    redis.enqueue_job = AsyncMock()
+    redis.aclose = AsyncMock()
+    return redis
+
+
+@pytest.fixture
+def client(redis):
+    """Test client of the API, running its lifespan against the mock pool."""
+    with patch("src.api.main.create_pool", AsyncMock(return_value=redis)):
+        with TestClient(app) as client:
+            yield client
+
+
+@pytest.fixture
+def redis_server():
+    """In-memory Redis server shared by the API and the test."""
+    return fakeredis.FakeServer()
+
+
+@pytest.fixture
+def store_client(redis_server):
+    """Test client of the API backed by the fake Redis server."""
+    async def create_pool(settings):
+        return aioredis.FakeRedis(server=redis_server)
+
+    with patch("src.api.main.create_pool", create_pool):
+        with TestClient(app) as client:
+            yield client
+
+
+def run_in_store(redis_server, operation):
+    """
+    Run job store operations against the fake Redis server.
+
+    Args:
+        redis_server: Fake Redis server
+        operation: Coroutine function called with a connection to the server
+
+    Returns:
+        Result of the operation
+    """
+    async def run():
+        redis = aioredis.FakeRedis(server=redis_server)
+        try:
+            return await operation(redis)
+        finally:
+            await redis.aclose()
+
+    return asyncio.run(run())
+
+
+class TestAPI:
+    """Test suite for the REST API endpoints."""
+
+    @patch("src.api.main.create_job", new_callable=AsyncMock)
+    @patch("src.api.main.get_sec_backoff", new_callable=AsyncMock, return_value=30)
+    def test_fetch_reports_sec_backoff(self, mock_backoff, mock_create_job, client, redis):
+        """Test that an active SEC back-off is returned as 429 with Retry-After."""
+        response = client.post("/api/v1/reports/fetch", json={"tickers": ["AAPL"]})
+
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "30"
+        assert response.json()["code"] == "agent.rate_limited"
+        # No job is queued while the SEC API is rate limiting the workers
+        mock_create_job.assert_not_called()
+        redis.enqueue_job.assert_not_called()
+
+    def test_download_report_not_modified(self, client, tmp_path):
+        """Test that a matching If-None-Match returns 304 without the PDF."""
+        pdf_path = tmp_path / "AAPL.pdf"
+        pdf_path.write_bytes(b"%PDF-1.7 test")
+        report = dict(_RESULT, pdf_path=str(pdf_path))
+        url = f"/api/v1/reports/download/{_JOB_ID}/AAPL"
+
+        with patch("src.api.main.load_job_result", AsyncMock(return_value=(True, report))):
+            response = client.get(url)
+            etag = response.headers["ETag"]
+            not_modified = client.get(url, headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.content == b"%PDF-1.7 test"
+        assert not_modified.status_code == 304
+        assert not_modified.headers["ETag"] == etag
+        assert not_modified.content == b""
+
+    @pytest.mark.parametrize("path", [
+        "/api/v1/reports/status/not-a-job-id",
+        "/api/v1/reports/download/not-a-job-id/AAPL",
+    ], ids=["status", "download"])
+    def test_malformed_job_id(self, client, path):
+        """Test that job IDs not matching JOB_ID_PATTERN are rejected before Redis is used."""
+        with patch("src.api.main.load_job", new_callable=AsyncMock) as mock_load_job, \
+                patch("src.api.main.load_job_result", new_callable=AsyncMock) as mock_load_result:
+            response = client.get(path)
+
+        assert response.status_code == 422
+        mock_load_job.assert_not_called()
+        mock_load_result.assert_not_called()
+
+
+class TestJobStatus:
+    """Test suite for the job status endpoint against the job store."""
+
+    @staticmethod
+    async def _create_job(redis, finished: bool) -> None:
+        await create_job(redis, _JOB_ID, total_companies=2, created_at="2025-11-01T00:00:00.000+00:00")
+        await record_result(redis, _JOB_ID, _RESULT)
+        if finished:
+            await record_result(redis, _JOB_ID, None)
+            await finish_job(redis, _JOB_ID, "completed", "2025-11-01T00:01:00.000+00:00")
+
+    def test_job_status_running(self, store_client, redis_server):
+        """Test the status of a running job, which is not cached."""
+        run_in_store(redis_server, lambda redis: self._create_job(redis, finished=False))
+
+        response = store_client.get(f"/api/v1/reports/status/{_JOB_ID}")
+
+        assert response.status_code == 200
+        assert response.json() == {
+            "job_id": _JOB_ID,
+            "status": "started",
+            "created_at": "2025-11-01T00:00:00.000+00:00",
+            "completed_at": None,
+            "total_companies": 2,
+            "processed": 1,
+            "successful": 1,
+            "failed": 0,
+            "results": [dict(_RESULT, status="success")],
+        }
+        assert not run_in_store(redis_server, lambda redis: redis.exists(response_key(_JOB_ID)))
+
+    def test_job_status_finished_is_cached(self, store_client, redis_server):
+        """Test that a finished job's status response is cached and served from Redis."""
+        run_in_store(redis_server, lambda redis: self._create_job(redis, finished=True))
+
+        first = store_client.get(f"/api/v1/reports/status/{_JOB_ID}")
+        # Changes to the job record no longer show once the response is cached
+        run_in_store(redis_server, lambda redis: redis.hset(job_key(_JOB_ID), "failed", 5))
+        second = store_client.get(f"/api/v1/reports/status/{_JOB_ID}")
+
+        assert first.status_code == 200
+        assert first.json()["status"] == "completed"
+        assert (first.json()["processed"], first.json()["failed"]) == (2, 1)
+        assert second.content == first.content
+
+    def test_job_status_not_found(self, store_client):
+        """Test that unknown jobs return 404."""
+        response = store_client.get(f"/api/v1/reports/status/{_JOB_ID}")
+
+        assert response.status_code == 404
+
+
+@patch("src.api.worker.cache_result", new_callable=AsyncMock)
+@patch("src.api.worker.get_sec_backoff", new_callable=AsyncMock, return_value=0)
+@patch("src.api.worker.get_cached_result", new_callable=AsyncMock, return_value=None)
+class TestWorker:
+    """Test suite for the ARQ worker's report fetching."""
+
+    @pytest.mark.asyncio
+    async def test_fetch_report_shares_inflight_fetch(
+        self, mock_cached, mock_backoff, mock_cache_result, tmp_path
+    ):
+        """Test that concurrent requests for one ticker process the company once."""
+        fetcher = Mock()
+        fetcher.process_company.return_value = _RESULT
+        semaphore = asyncio.Semaphore(4)
+
+        results = await asyncio.gather(*(
+            fetch_report(Mock(), fetcher, "AAPL", tmp_path, semaphore) for _ in range(3)
+        ))
+
+        assert results == [_RESULT] * 3
+        fetcher.process_company.assert_called_once_with("AAPL", "0000320193", tmp_path)
+        mock_cache_result.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    @patch("src.api.worker.set_sec_backoff", new_callable=AsyncMock)
+    async def test_fetch_report_rate_limited(
+        self, mock_set_backoff, mock_cached, mock_backoff, mock_cache_result, tmp_path
+    ):
+        """Test that an SEC rate limit is recorded as a back-off for the API."""
+        redis = Mock()
+        fetcher = Mock()
+        fetcher.process_company.side_effect = SECRateLimitError("rate limited", 30)
+
+        result = await fetch_report(redis, fetcher, "AAPL", tmp_path, asyncio.Semaphore(1))
+
+        assert result is None
+        mock_set_backoff.assert_awaited_once_with(redis, 30)
+        mock_cache_result.assert_not_called()
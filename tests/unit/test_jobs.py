@@ -0,0 +1,161 @@
+"""
+Unit tests for the Redis job store of the SEC 10-K Fetcher API
+
+Tests cover:
+- Job records, per-ticker results and their TTLs
+- Cached status responses of finished jobs
+- Cached PDF results
+- The SEC rate limit back-off
+
+The store runs against fakeredis, which speaks the same async API as the
+ArqRedis pool used by the API and the workers.
+"""
+
+import pytest
+from fakeredis import aioredis
+
+# The repository root is put on sys.path by conftest.py
+from src.api.jobs import (
+    JOB_TTL_SECONDS,
+    PDF_CACHE_TTL_SECONDS,
+    SEC_BACKOFF_KEY,
+    create_job,
+    record_result,
+    finish_job,
+    load_job,
+    load_job_result,
+    load_status_response,
+    cache_status_response,
+    get_cached_result,
+    cache_result,
+    set_sec_backoff,
+    get_sec_backoff,
+    job_key,
+    results_key,
+    tickers_key,
+    response_key,
+    pdf_cache_key,
+)
+
+_JOB_ID = "0123456789abcdef0123456789abcdef"
+
+_RESULT = {
+    "ticker": "AAPL",
+    "cik": "0000320193",
+    "filing_date": "2025-10-31",
+    "accession_number": "0000320193-25-000079",
+    "pdf_path": "AAPL_0000320193-25-000079_2025-10-31.pdf"
+}
+
+
+@pytest.fixture
+def redis():
+    """Empty in-memory Redis."""
+    return aioredis.FakeRedis()
+
+
+async def assert_ttl(redis, key: str, expected: int) -> None:
+    """Assert that a key expires after the expected seconds (allowing for a clock tick)."""
+    assert expected - 1 <= await redis.ttl(key) <= expected
+
+
+class TestJobStore:
+    """Test suite for job records."""
+
+    @pytest.mark.asyncio
+    async def test_create_job(self, redis):
+        """Test that a new job is stored with zeroed counters and a TTL."""
+        await create_job(redis, _JOB_ID, total_companies=2, created_at="2025-11-01T00:00:00.000+00:00")
+
+        job = await load_job(redis, _JOB_ID)
+
+        assert job == {
+            "job_id": _JOB_ID,
+            "status": "started",
+            "created_at": "2025-11-01T00:00:00.000+00:00",
+            "completed_at": None,
+            "total_companies": 2,
+            "processed": 0,
+            "successful": 0,
+            "failed": 0,
+            "results": [],
+        }
+        await assert_ttl(redis, job_key(_JOB_ID), JOB_TTL_SECONDS)
+
+    @pytest.mark.asyncio
+    async def test_load_missing_job(self, redis):
+        """Test that unknown jobs are reported as missing."""
+        assert await load_job(redis, _JOB_ID) is None
+        assert await load_job_result(redis, _JOB_ID, "AAPL") == (False, None)
+
+    @pytest.mark.asyncio
+    async def test_record_results_and_finish_job(self, redis):
+        """Test that results are counted, indexed by ticker and kept with the job."""
+        await create_job(redis, _JOB_ID, total_companies=2, created_at="2025-11-01T00:00:00.000+00:00")
+
+        await record_result(redis, _JOB_ID, _RESULT)
+        await record_result(redis, _JOB_ID, None)
+        await finish_job(redis, _JOB_ID, "completed", "2025-11-01T00:01:00.000+00:00")
+
+        job = await load_job(redis, _JOB_ID)
+        assert job["status"] == "completed"
+        assert job["completed_at"] == "2025-11-01T00:01:00.000+00:00"
+        assert (job["processed"], job["successful"], job["failed"]) == (2, 1, 1)
+        assert job["results"] == [_RESULT]
+        assert await load_job_result(redis, _JOB_ID, "AAPL") == (True, _RESULT)
+        assert await load_job_result(redis, _JOB_ID, "META") == (True, None)
+        for key in (job_key(_JOB_ID), results_key(_JOB_ID), tickers_key(_JOB_ID)):
+            await assert_ttl(redis, key, JOB_TTL_SECONDS)
+
+    @pytest.mark.asyncio
+    async def test_finish_failed_job(self, redis):
+        """Test that the error of a failed job is stored with it."""
+        await create_job(redis, _JOB_ID, total_companies=1, created_at="2025-11-01T00:00:00.000+00:00")
+
+        await finish_job(redis, _JOB_ID, "failed", "2025-11-01T00:01:00.000+00:00", error="boom")
+
+        job = await load_job(redis, _JOB_ID)
+        assert job["status"] == "failed"
+        assert job["error"] == "boom"
+
+    @pytest.mark.asyncio
+    async def test_status_response_cache(self, redis):
+        """Test that a finished job's serialized status response is cached with the job TTL."""
+        assert await load_status_response(redis, _JOB_ID) is None
+
+        await cache_status_response(redis, _JOB_ID, '{"job_id": "test"}')
+
+        assert await load_status_response(redis, _JOB_ID) == b'{"job_id": "test"}'
+        await assert_ttl(redis, response_key(_JOB_ID), JOB_TTL_SECONDS)
+
+
+class TestResultCache:
+    """Test suite for cached PDF results and the SEC back-off."""
+
+    @pytest.mark.asyncio
+    async def test_cached_result(self, redis, tmp_path):
+        """Test that a cached PDF is reused only while its file exists."""
+        pdf_path = tmp_path / "AAPL.pdf"
+        pdf_path.write_bytes(b"%PDF")
+        result = dict(_RESULT, pdf_path=str(pdf_path))
+
+        assert await get_cached_result(redis, "AAPL", tmp_path) is None
+        await cache_result(redis, result, tmp_path)
+
+        assert await get_cached_result(redis, "AAPL", tmp_path) == result
+        await assert_ttl(redis, pdf_cache_key("AAPL", tmp_path), PDF_CACHE_TTL_SECONDS)
+        # Cached per output directory
+        assert await get_cached_result(redis, "AAPL", tmp_path / "other") is None
+
+        pdf_path.unlink()
+        assert await get_cached_result(redis, "AAPL", tmp_path) is None
+
+    @pytest.mark.asyncio
+    async def test_sec_backoff(self, redis):
+        """Test that the SEC back-off lasts for the given Retry-After."""
+        assert await get_sec_backoff(redis) == 0
+
+        await set_sec_backoff(redis, 30)
+
+        assert 29 <= await get_sec_backoff(redis) <= 30
+        await assert_ttl(redis, SEC_BACKOFF_KEY, 30)
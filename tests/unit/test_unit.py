@@ -9,61 +9,194 @@ Tests cover:
 - Error handling
 """
 
+import io
+import sys
+import contextlib
 import pytest
 import json
+import orjson
+import threading
 import requests
+import responses
 from pathlib import Path
-from unittest.mock import Mock, patch, MagicMock
-from typing import Dict
-
-import sys
-from pathlib import Path
-
-# Add src directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+from unittest.mock import Mock, MagicMock, call, patch
+from types import MappingProxyType
+from typing import Dict, List, Optional
 
+# The repository root is put on sys.path by conftest.py
 from src.sec10k_fetcher import (
     SEC10KFetcher,
     SECAPIError,
+    SECRateLimitError,
     PDFConversionError,
     TICKER_TO_CIK,
-    fetch_10k_reports
+    CIK_TO_TICKER,
+    fetch_10k_reports,
+    afetch_10k_reports
 )
 
 
-class TestSEC10KFetcher:
-    """Test suite for SEC10KFetcher class."""
+@pytest.fixture(scope="session")
+def fetcher():
+    """
+    Create a SEC10KFetcher instance shared by all tests.
     
-    @pytest.fixture
-    def fetcher(self):
-        """Create a SEC10KFetcher instance for testing."""
-        return SEC10KFetcher(user_agent="Test Agent", request_delay=0.01)
+    Tests that replace its methods do so through monkeypatch, which restores
+    them after each test.
+    """
+    # Without the in-memory submissions cache, so tests don't see each other's
+    # responses
+    fetcher = SEC10KFetcher(
+        user_agent="Test Agent", request_delay=0.01, cache_path=None, submissions_ttl=0
+    )
+    yield fetcher
+    fetcher.close()
+
+
+class FakeResponse:
+    """
+    Minimal stand-in for requests.Response.
     
-    @pytest.fixture
-    def mock_submissions(self):
-        """Mock SEC submissions JSON response."""
-        return {
-            "cik": "0000320193",
-            "name": "Apple Inc.",
-            "filings": {
-                "recent": {
-                    "form": ["10-K", "10-Q", "8-K", "10-K"],
-                    "accessionNumber": [
-                        "0000320193-25-000079",
-                        "0000320193-25-000050",
-                        "0000320193-25-000040",
-                        "0000320193-24-000090"
-                    ],
-                    "filingDate": ["2025-10-31", "2025-08-01", "2025-07-15", "2024-11-01"],
-                    "primaryDocument": [
-                        "aapl-20250927.htm",
-                        "aapl-20250629.htm",
-                        "form8k.htm",
-                        "aapl-20240928.htm"
-                    ]
-                }
-            }
+    Only the attributes the fetcher reads exist, and __slots__ keeps them out
+    of a per-instance __dict__, so it is cheaper to build than a spec'd mock.
+    """
+    
+    __slots__ = ("content", "status_code", "headers", "chunks")
+    
+    def __init__(self, content: bytes = b"", status_code: int = 200,
+                 headers: Optional[Dict] = None, chunks: Optional[List[bytes]] = None):
+        """
+        Initialize the response.
+        
+        Args:
+            content: Response body
+            status_code: HTTP status code
+            headers: Response headers
+            chunks: Body chunks yielded by iter_content (defaults to the whole content)
+        """
+        self.content = content
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.chunks = chunks if chunks is not None else [content]
+    
+    def iter_content(self, chunk_size: Optional[int] = None):
+        """Yield the body chunks."""
+        return iter(self.chunks)
+    
+    def json(self):
+        """Parse the body as JSON."""
+        return json.loads(self.content)
+    
+    def raise_for_status(self) -> None:
+        """Raise HTTPError for error status codes."""
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error", response=self)
+    
+    def close(self) -> None:
+        """Release the connection (nothing to release)."""
+
+
+# Mock SEC submissions JSON response, built once (tests only read it)
+_MOCK_SUBMISSIONS = {
+    "cik": "0000320193",
+    "name": "Apple Inc.",
+    "filings": {
+        "recent": {
+            "form": ("10-K", "10-Q", "8-K", "10-K"),
+            "accessionNumber": (
+                "0000320193-25-000079",
+                "0000320193-25-000050",
+                "0000320193-25-000040",
+                "0000320193-24-000090"
+            ),
+            "filingDate": ("2025-10-31", "2025-08-01", "2025-07-15", "2024-11-01"),
+            "primaryDocument": (
+                "aapl-20250927.htm",
+                "aapl-20250629.htm",
+                "form8k.htm",
+                "aapl-20240928.htm"
+            )
+        }
+    }
+}
+
+
+# Submissions endpoint of the mock company (Apple)
+_SUBMISSIONS_URL = "https://data.sec.gov/submissions/CIK0000320193.json"
+
+# Submissions with a malformed filing date
+_INVALID_DATE_SUBMISSIONS = {
+    "filings": {
+        "recent": {
+            "form": ("10-K", "10-K", "10-K"),
+            "accessionNumber": ("bad-date", "older", "newer"),
+            "filingDate": ("2026-1-5", "2024-11-01", "2025-10-31"),
+            "primaryDocument": ("bad.htm", "older.htm", "newer.htm")
+        }
+    }
+}
+
+# Submissions without any filings
+_EMPTY_SUBMISSIONS = {
+    "filings": {
+        "recent": {
+            "form": (),
+            "accessionNumber": (),
+            "filingDate": (),
+            "primaryDocument": ()
+        }
+    }
+}
+
+# Submissions with only other forms than 10-K
+_NO_10K_SUBMISSIONS = {
+    "filings": {
+        "recent": {
+            "form": ("10-Q", "8-K"),
+            "accessionNumber": ("0000320193-25-000050", "0000320193-25-000040"),
+            "filingDate": ("2025-08-01", "2025-07-15"),
+            "primaryDocument": ("aapl-20250629.htm", "form8k.htm")
         }
+    }
+}
+
+
+@pytest.fixture(scope="module")
+def mock_submissions():
+    """Mock SEC submissions JSON response (read-only, shared by all tests)."""
+    return MappingProxyType(_MOCK_SUBMISSIONS)
+
+
+@pytest.fixture(scope="module")
+def submissions_json(mock_submissions) -> bytes:
+    """Mock submissions serialized as returned by the SEC API."""
+    return json.dumps(dict(mock_submissions)).encode()
+
+
+@pytest.fixture(scope="module")
+def parsed_submissions(submissions_json) -> Dict:
+    """Mock submissions parsed the way the fetcher parses them (orjson)."""
+    parsed = orjson.loads(submissions_json)
+    # orjson must decode SEC responses exactly like the stdlib decoder
+    assert parsed == json.loads(submissions_json)
+    return parsed
+
+
+@pytest.fixture
+def process_mocks():
+    """Patch the network and PDF steps of process_company.
+    
+    Yields:
+        The (get_company_submissions, download_filing, convert_to_pdf) mocks
+    """
+    with patch.object(SEC10KFetcher, "get_company_submissions") as mock_get_submissions, \
+            patch.object(SEC10KFetcher, "download_filing") as mock_download, \
+            patch.object(SEC10KFetcher, "convert_to_pdf") as mock_convert:
+        yield mock_get_submissions, mock_download, mock_convert
+
+
+class TestSEC10KFetcher:
+    """Test suite for SEC10KFetcher class."""
     
     def test_initialization(self, fetcher):
         """Test SEC10KFetcher initialization."""
@@ -71,69 +204,69 @@ class TestSEC10KFetcher:
         assert fetcher.request_delay == 0.01
         assert "Test Agent" in fetcher.session.headers["User-Agent"]
     
-    def test_find_latest_10k(self, fetcher, mock_submissions):
-        """Test finding the latest 10-K filing."""
-        result = fetcher.find_latest_10k(mock_submissions)
-        
-        assert result is not None
-        assert result["formType"] == "10-K"
-        assert result["filingDate"] == "2025-10-31"
-        assert result["accessionNumber"] == "0000320193-25-000079"
-        assert result["primaryDocument"] == "aapl-20250927.htm"
-    
-    def test_find_latest_10k_no_filings(self, fetcher):
-        """Test finding 10-K when no filings exist."""
-        empty_submissions = {
-            "filings": {
-                "recent": {
-                    "form": [],
-                    "accessionNumber": [],
-                    "filingDate": [],
-                    "primaryDocument": []
-                }
-            }
-        }
-        result = fetcher.find_latest_10k(empty_submissions)
-        assert result is None
-    
-    def test_find_latest_10k_no_10k(self, fetcher):
-        """Test finding 10-K when only other forms exist."""
-        no_10k_submissions = {
-            "filings": {
-                "recent": {
-                    "form": ["10-Q", "8-K"],
-                    "accessionNumber": ["0000320193-25-000050", "0000320193-25-000040"],
-                    "filingDate": ["2025-08-01", "2025-07-15"],
-                    "primaryDocument": ["aapl-20250629.htm", "form8k.htm"]
-                }
-            }
-        }
-        result = fetcher.find_latest_10k(no_10k_submissions)
-        assert result is None
+    @pytest.mark.parametrize("submissions,expected", [
+        (_MOCK_SUBMISSIONS, {
+            "formType": "10-K",
+            "accessionNumber": "0000320193-25-000079",
+            "filingDate": "2025-10-31",
+            "primaryDocument": "aapl-20250927.htm"
+        }),
+        (_INVALID_DATE_SUBMISSIONS, {
+            "formType": "10-K",
+            "accessionNumber": "newer",
+            "filingDate": "2025-10-31",
+            "primaryDocument": "newer.htm"
+        }),
+        (_EMPTY_SUBMISSIONS, None),
+        (_NO_10K_SUBMISSIONS, None),
+    ], ids=["has-10k", "invalid-dates", "empty", "no-10k"])
+    def test_find_latest_10k(self, fetcher, submissions, expected):
+        """Test finding the latest 10-K filing (malformed dates are ignored)."""
+        result = fetcher.find_latest_10k(submissions)
+        
+        if expected is None:
+            assert result is None
+        else:
+            assert result == expected
     
-    @patch('src.sec10k_fetcher.fetcher.requests.Session.get')
-    def test_get_company_submissions_success(self, mock_get, fetcher, mock_submissions):
+    @responses.activate
+    def test_get_company_submissions_success(self, fetcher, submissions_json, parsed_submissions):
         """Test successful retrieval of company submissions."""
-        mock_response = Mock()
-        mock_response.json.return_value = mock_submissions
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        responses.add(responses.GET, _SUBMISSIONS_URL, body=submissions_json, status=200)
         
         result = fetcher.get_company_submissions("0000320193")
         
-        assert result == mock_submissions
-        mock_get.assert_called_once()
+        assert result == parsed_submissions
+        assert len(responses.calls) == 1
     
-    def test_get_company_submissions_api_error(self, fetcher):
+    @responses.activate
+    @patch('src.sec10k_fetcher.fetcher.time.monotonic')
+    def test_get_company_submissions_cached(self, mock_monotonic):
+        """Test that repeated lookups of a company reuse its parsed submissions."""
+        responses.add(responses.GET, _SUBMISSIONS_URL, json={"cik": "test"})
+        mock_monotonic.return_value = 100.0
+        fetcher = SEC10KFetcher(user_agent="Test Agent", request_delay=0, cache_path=None)
+        
+        first = fetcher.get_company_submissions("0000320193")
+        assert fetcher.get_company_submissions("0000320193") is first
+        assert len(responses.calls) == 1
+        
+        # Fetched again once the TTL has passed
+        mock_monotonic.return_value += fetcher.submissions_ttl
+        fetcher.get_company_submissions("0000320193")
+        assert len(responses.calls) == 2
+        # The expired entry is replaced rather than kept alongside the new one
+        assert len(fetcher._submissions_cache) == 1
+    
+    def test_get_company_submissions_api_error(self, fetcher, monkeypatch):
         """Test handling of API errors."""
-        # Patch the _make_request method to raise an exception
-        original_make_request = fetcher._make_request
-        
+        # Patch the _make_request method to raise an exception (restored by
+        # monkeypatch, since the fetcher is shared between tests)
         def failing_request(url, headers=None):
             # Raise RequestException which _make_request converts to SECAPIError
             raise requests.exceptions.RequestException("Network error")
         
-        fetcher._make_request = failing_request
+        monkeypatch.setattr(fetcher, "_make_request", failing_request)
         
         # Since we're patching _make_request directly, it raises RequestException
         # which bubbles up. However, _make_request normally converts this to SECAPIError.
@@ -143,36 +276,114 @@ class TestSEC10KFetcher:
         
         # Verify an exception was raised (could be RequestException or SECAPIError)
         assert exc_info.value is not None
-        
-        fetcher._make_request = original_make_request
     
-    def test_download_filing_success(self, fetcher, tmp_path):
+    @pytest.mark.parametrize("revalidate,validators", [
+        (False, None),
+        (True, b'{"etag":"\\"abc123\\"","last_modified":null}'),
+    ], ids=["default", "revalidate"])
+    def test_download_filing_success(self, fetcher, tmp_path, monkeypatch, revalidate, validators):
         """Test successful file download."""
         # Patch the _make_request method to return a mock response
-        original_make_request = fetcher._make_request
-        mock_response = Mock()
-        mock_response.content = b"<html>Test filing</html>"
+        mock_response = FakeResponse(
+            headers={"ETag": '"abc123"'}, chunks=[b"<html>Test ", b"filing</html>"]
+        )
         
-        def mock_request(url, headers=None):
+        def mock_request(url, headers=None, stream=False):
+            assert stream  # Filing is streamed to disk
             return mock_response
         
-        fetcher._make_request = mock_request
+        monkeypatch.setattr(fetcher, "_make_request", mock_request)
+        # Image extraction is covered separately and would need the file on disk
+        monkeypatch.setattr(fetcher, "_download_html_images", Mock(return_value=set()))
+        
+        # Capture the written filing in memory instead of on disk
+        written = io.BytesIO()
+        mock_open = Mock(return_value=contextlib.nullcontext(written))
+        with patch("src.sec10k_fetcher.fetcher.open", mock_open, create=True), \
+                patch("pathlib.Path.write_bytes") as mock_write_bytes:
+            result = fetcher.download_filing(
+                cik="0000320193",
+                accession_number="0000320193-25-000079",
+                document_name="aapl-20250927.htm",
+                output_dir=tmp_path,
+                revalidate=revalidate
+            )
+        
+        assert result == tmp_path / "aapl-20250927.htm"
+        assert mock_open.call_args.args == (result, "wb")
+        assert written.getvalue() == b"<html>Test filing</html>"
+        # The ETag is only kept when the filing is to be revalidated later
+        if validators is None:
+            mock_write_bytes.assert_not_called()
+        else:
+            mock_write_bytes.assert_called_once_with(validators)
+    
+    def test_download_filing_not_modified(self, fetcher, tmp_path, monkeypatch):
+        """Test that an unchanged filing is revalidated instead of downloaded again."""
+        local_file = tmp_path / "aapl-20250927.htm"
+        local_file.write_bytes(b"<html>Cached filing</html>")
+        (tmp_path / "aapl-20250927.htm.meta.json").write_text('{"etag": "\\"abc123\\""}')
+        
+        # A body written despite the 304 would overwrite the cached filing
+        mock_response = FakeResponse(status_code=304, chunks=[b"unexpected"])
+        mock_request = Mock(return_value=mock_response)
+        monkeypatch.setattr(fetcher, "_make_request", mock_request)
         
         result = fetcher.download_filing(
             cik="0000320193",
             accession_number="0000320193-25-000079",
             document_name="aapl-20250927.htm",
-            output_dir=tmp_path
+            output_dir=tmp_path,
+            revalidate=True
+        )
+        
+        assert mock_request.call_args.kwargs["headers"]["If-None-Match"] == '"abc123"'
+        assert result.read_bytes() == b"<html>Cached filing</html>"
+    
+    def test_download_html_images_uses_filing_index(self, fetcher, tmp_path, monkeypatch):
+        """Test that only images listed in the filing's index.json are downloaded."""
+        html_file = tmp_path / "filing.htm"
+        html_file.write_text('<img src="logo.jpg"><img src="stale.png"><img src="logo.jpg">')
+        
+        index_response = FakeResponse(json.dumps({"directory": {"item": [
+            {"name": "filing.htm"}, {"name": "logo.jpg"}, {"name": "chart.gif"}
+        ]}}).encode())
+        image_response = FakeResponse(b"jpg-data")
+        requested = []
+        
+        def mock_request(url, headers=None, stream=False):
+            requested.append(url)
+            return index_response if url.endswith("index.json") else image_response
+        
+        monkeypatch.setattr(fetcher, "_make_request", mock_request)
+        
+        downloaded = fetcher._download_html_images(html_file, "0000320193", "0000320193-25-000079")
+        
+        assert downloaded == {"logo.jpg"}
+        assert requested == [
+            "https://www.sec.gov/Archives/edgar/data/320193/000032019325000079/index.json",
+            "https://www.sec.gov/Archives/edgar/data/320193/000032019325000079/logo.jpg",
+        ]
+        assert (tmp_path / "logo.jpg").read_bytes() == b"jpg-data"
+    
+    @responses.activate
+    def test_download_html_images_rate_limited(self, fetcher, tmp_path):
+        """Test that a 429 on the filing index propagates instead of dropping the images."""
+        html_file = tmp_path / "filing.htm"
+        html_file.write_text('<img src="logo.jpg">')
+        responses.add(
+            responses.GET,
+            "https://www.sec.gov/Archives/edgar/data/320193/000032019325000079/index.json",
+            status=429, headers={"Retry-After": "30"}
         )
         
-        assert result.exists()
-        assert result.name == "aapl-20250927.htm"
-        with open(result, "rb") as f:
-            assert f.read() == b"<html>Test filing</html>"
+        with pytest.raises(SECRateLimitError) as exc_info:
+            fetcher._download_html_images(html_file, "0000320193", "0000320193-25-000079")
         
-        fetcher._make_request = original_make_request
+        assert exc_info.value.retry_after == 30
+        # No images are requested once the SEC rate limits the fetcher
+        assert len(responses.calls) == 1
     
-    @patch('src.sec10k_fetcher.fetcher.HTML')
     def test_convert_html_to_pdf(self, mock_html_class, fetcher, tmp_path):
         """Test HTML to PDF conversion."""
         html_file = tmp_path / "test.htm"
@@ -188,14 +399,157 @@ class TestSEC10KFetcher:
         assert result == pdf_file
         mock_html_class.assert_called_once()
         mock_html_instance.write_pdf.assert_called_once()
+        # The PDF is written to an open file and moved into place when complete
+        partial_name = Path(mock_html_instance.write_pdf.call_args.args[0].name).name
+        assert partial_name.startswith("test.pdf") and partial_name.endswith(".part")
+        assert pdf_file.exists()
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["test.htm", "test.pdf"]
+    
+    def test_convert_failure_leaves_no_pdf(self, mock_html_class, fetcher, tmp_path):
+        """Test that a failed conversion doesn't leave a partial PDF behind."""
+        html_file = tmp_path / "test.htm"
+        html_file.write_text("<html><body>Test</body></html>")
+        mock_html_class.return_value.write_pdf.side_effect = RuntimeError("render failed")
+        
+        with pytest.raises(PDFConversionError):
+            fetcher.convert_to_pdf(html_file, tmp_path / "test.pdf")
+        
+        assert sorted(p.name for p in tmp_path.iterdir()) == ["test.htm"]
+    
+    def test_convert_failure_keeps_other_partial_pdfs(self, mock_html_class, fetcher, tmp_path):
+        """Test that a failed conversion doesn't remove a concurrent render's partial PDF."""
+        html_file = tmp_path / "test.htm"
+        html_file.write_text("<html><body>Test</body></html>")
+        other_partial = tmp_path / "test.pdf.part"
+        other_partial.write_bytes(b"%PDF-partial")
+        mock_html_class.return_value.write_pdf.side_effect = RuntimeError("render failed")
+        
+        with pytest.raises(PDFConversionError):
+            fetcher.convert_to_pdf(html_file, tmp_path / "test.pdf")
+        
+        assert other_partial.read_bytes() == b"%PDF-partial"
+    
+    def test_convert_html_inlines_images(self, mock_html_class, fetcher, tmp_path):
+        """Test that downloaded images are inlined as data URIs before conversion."""
+        html_file = tmp_path / "test.htm"
+        (tmp_path / "logo.png").write_bytes(b"png-data")
+        html_file.write_text('<img src="logo.png"><img src="missing.jpg">')
+        
+        fetcher.convert_to_pdf(html_file, tmp_path / "test.pdf")
+        
+        html_content = mock_html_class.call_args.kwargs["file_obj"].getvalue()
+        assert b'src="data:image/png;base64,cG5nLWRhdGE="' in html_content
+        # Images that weren't downloaded are left for WeasyPrint to resolve
+        assert b'src="missing.jpg"' in html_content
+    
+    def test_image_refs_downloaded_and_inlined_alike(self, mock_html_class, fetcher, tmp_path):
+        """Test that every downloaded image ref is inlined, or left as-is without an image suffix."""
+        from src.sec10k_fetcher.fetcher import _find_local_image_refs
+        
+        html_file = tmp_path / "test.htm"
+        html_file.write_text(
+            '<img src="logo.png"><div style="background: url(chart.gif)"></div>'
+            '<img src="img.php?f=photo.jpg">'
+        )
+        # Downloaded under the basename of the ref's path, as _download_image does
+        for name in ("logo.png", "chart.gif", "img.php"):
+            (tmp_path / name).write_bytes(b"data")
+        
+        refs = _find_local_image_refs(html_file)
+        fetcher.convert_to_pdf(html_file, tmp_path / "test.pdf")
+        
+        assert refs == ["logo.png", "chart.gif", "img.php?f=photo.jpg"]
+        html_content = mock_html_class.call_args.kwargs["file_obj"].getvalue()
+        assert b"url(data:image/gif;base64," in html_content
+        assert b'src="data:image/png;base64,' in html_content
+        assert b'src="img.php?f=photo.jpg"' in html_content
+    
+    @patch('src.sec10k_fetcher.fetcher.URLFetcher')
+    def test_convert_reuses_url_fetcher(self, mock_url_fetcher, mock_html_class, tmp_path):
+        """Test that conversions in a thread share one WeasyPrint URL fetcher."""
+        html_file = tmp_path / "test.htm"
+        html_file.write_text("<html><body>Test</body></html>")
+        # Own fetcher, since the shared one may already hold this thread's fetcher
+        fetcher = SEC10KFetcher(user_agent="Test Agent", cache_path=None)
+        
+        fetcher.convert_to_pdf(html_file, tmp_path / "first.pdf")
+        fetcher.convert_to_pdf(html_file, tmp_path / "second.pdf")
+        
+        mock_url_fetcher.assert_called_once()
+        # Resources fetched while rendering use the fetcher's own User-Agent
+        assert mock_url_fetcher.call_args.kwargs["http_headers"]["User-Agent"] == "Test Agent"
+        for call in mock_html_class.call_args_list:
+            assert call.kwargs["url_fetcher"] is mock_url_fetcher.return_value
+    
+    @patch('src.sec10k_fetcher.fetcher.URLFetcher', None)
+    def test_convert_without_url_fetcher_class(self, mock_html_class, tmp_path):
+        """Test that WeasyPrint's default URL fetcher is kept before WeasyPrint 70."""
+        html_file = tmp_path / "test.htm"
+        html_file.write_text("<html><body>Test</body></html>")
+        fetcher = SEC10KFetcher(user_agent="Test Agent", cache_path=None)
+        
+        fetcher.convert_to_pdf(html_file, tmp_path / "test.pdf")
+        
+        # url_fetcher=None would replace HTML's default_url_fetcher
+        assert "url_fetcher" not in mock_html_class.call_args.kwargs
+    
+    def test_unsupported_pdf_engine(self):
+        """Test that an unknown PDF engine is rejected."""
+        with pytest.raises(ValueError):
+            SEC10KFetcher(user_agent="Test Agent", cache_path=None, engine="unknown")
+    
+    @pytest.fixture
+    def mock_playwright(self):
+        """Stand-in for playwright.sync_api, yielding the launched browser's mock."""
+        sync_api = MagicMock()
+        playwright = sync_api.sync_playwright.return_value.start.return_value
+        browser = playwright.chromium.launch.return_value
+        browser.new_page.return_value.pdf.return_value = b"%PDF-chromium"
+        with patch.dict(sys.modules, {"playwright": MagicMock(), "playwright.sync_api": sync_api}):
+            yield browser
+    
+    def test_convert_with_chromium(self, mock_playwright, tmp_path):
+        """Test that the chromium engine renders filings in one browser, stopped by close()."""
+        html_file = tmp_path / "test.htm"
+        html_file.write_text("<html><body>Test</body></html>")
+        txt_file = tmp_path / "test.txt"
+        txt_file.write_text("Test text content </pre>")
+        fetcher = SEC10KFetcher(user_agent="Test Agent", cache_path=None, engine="chromium")
+        page = mock_playwright.new_page.return_value
+        
+        fetcher.convert_to_pdf(html_file, tmp_path / "html.pdf")
+        fetcher.convert_to_pdf(txt_file, tmp_path / "txt.pdf")
+        fetcher.close()
+        
+        # HTML filings are loaded from disk, text is wrapped in escaped HTML
+        page.goto.assert_called_once_with(html_file.resolve().as_uri())
+        assert "Test text content &lt;/pre&gt;" in page.set_content.call_args.args[0]
+        assert page.pdf.call_args_list == [call(format="Letter")] * 2
+        assert (tmp_path / "html.pdf").read_bytes() == b"%PDF-chromium"
+        assert page.close.call_count == 2
+        # Both conversions share the browser, which close() stops
+        mock_playwright.close.assert_called_once()
+    
+    def test_chromium_stopped_at_render_process_exit(self, mock_playwright, tmp_path):
+        """Test that a browser launched in a render process's main thread is stopped at exit."""
+        from src.sec10k_fetcher.fetcher import _close_chromium, _render_pdf
+        
+        html_file = tmp_path / "test.htm"
+        html_file.write_text("<html><body>Test</body></html>")
+        
+        with patch("src.sec10k_fetcher.fetcher.atexit") as mock_atexit:
+            _render_pdf(html_file, tmp_path / "test.pdf", engine="chromium")
+        _close_chromium()
+        
+        mock_atexit.register.assert_called_once_with(_close_chromium)
+        mock_playwright.close.assert_called_once()
     
-    @patch('src.sec10k_fetcher.fetcher.HTML')
     def test_convert_txt_to_pdf(self, mock_html_class, fetcher, tmp_path):
         """Test TXT to PDF conversion."""
         txt_file = tmp_path / "test.txt"
         pdf_file = tmp_path / "test.pdf"
         
-        txt_file.write_text("Test text content")
+        txt_file.write_text("Test text content </pre><b>")
         
         mock_html_instance = Mock()
         mock_html_class.return_value = mock_html_instance
@@ -203,98 +557,113 @@ class TestSEC10KFetcher:
         result = fetcher.convert_to_pdf(txt_file, pdf_file)
         
         assert result == pdf_file
-        # Should create temporary HTML file
-        assert mock_html_class.call_count >= 1
-    
-    @patch.object(SEC10KFetcher, 'get_company_submissions')
-    @patch.object(SEC10KFetcher, 'download_filing')
-    @patch.object(SEC10KFetcher, 'convert_to_pdf')
-    def test_process_company_success(
-        self, mock_convert, mock_download, mock_submissions, fetcher, tmp_path
-    ):
-        """Test successful processing of a company."""
-        mock_submissions_data = {
-            "filings": {
-                "recent": {
-                    "form": ["10-K"],
-                    "accessionNumber": ["0000320193-25-000079"],
-                    "filingDate": ["2025-10-31"],
-                    "primaryDocument": ["aapl-20250927.htm"]
-                }
-            }
-        }
-        mock_submissions.return_value = mock_submissions_data
-        (tmp_path / "temp").mkdir(parents=True)
-        mock_file = tmp_path / "temp" / "test.htm"
-        # Create the file that will be returned by mock_download
-        # This prevents FileNotFoundError when unlink() is called
-        mock_file.write_text("<html>Test</html>")
-        mock_download.return_value = mock_file
+        # Text is rendered from a string, escaped, without a temporary HTML file
+        html_content = mock_html_class.call_args.kwargs["string"]
+        assert "Test text content &lt;/pre&gt;&lt;b&gt;" in html_content
+        assert not txt_file.with_suffix(".html").exists()
+    
+    @pytest.mark.parametrize("submissions,expect_none", [
+        (_MOCK_SUBMISSIONS, False),
+        (_NO_10K_SUBMISSIONS, True),
+    ], ids=["has-10k", "no-10k"])
+    def test_process_company(self, process_mocks, fetcher, tmp_path, submissions, expect_none):
+        """Test processing a company with and without a 10-K filing."""
+        mock_get_submissions, mock_download, mock_convert = process_mocks
+        mock_get_submissions.return_value = submissions
+        # Download and conversion are mocked, so the file never has to exist
+        mock_download.return_value = tmp_path / "temp" / "test.htm"
         
         result = fetcher.process_company("AAPL", "0000320193", tmp_path)
         
+        mock_get_submissions.assert_called_once()
+        if expect_none:
+            assert result is None
+            mock_download.assert_not_called()
+            mock_convert.assert_not_called()
+            return
+        
         assert result is not None
         assert result["ticker"] == "AAPL"
         assert result["cik"] == "0000320193"
         assert "pdf_path" in result
-        mock_submissions.assert_called_once()
         mock_download.assert_called_once()
         mock_convert.assert_called_once()
+        # Downloads go to a per-company temporary directory that is removed afterwards
+        temp_dir = mock_download.call_args.kwargs["output_dir"]
+        assert temp_dir.parent == tmp_path
+        assert not temp_dir.exists()
     
-    @patch.object(SEC10KFetcher, 'get_company_submissions')
-    def test_process_company_no_10k(self, mock_submissions, fetcher, tmp_path):
-        """Test processing when no 10-K is found."""
-        no_10k_data = {
-            "filings": {
-                "recent": {
-                    "form": ["10-Q"],
-                    "accessionNumber": ["0000320193-25-000050"],
-                    "filingDate": ["2025-08-01"],
-                    "primaryDocument": ["aapl-20250629.htm"]
-                }
-            }
-        }
-        mock_submissions.return_value = no_10k_data
+    def test_process_company_new_output_dir(self, process_mocks, fetcher, mock_submissions, tmp_path):
+        """Test processing into an output directory that doesn't exist yet."""
+        mock_get_submissions, mock_download, mock_convert = process_mocks
+        mock_get_submissions.return_value = mock_submissions
+        output_dir = tmp_path / "output" / "pdfs"
+        
+        result = fetcher.process_company("AAPL", "0000320193", output_dir)
+        
+        assert result is not None
+        assert output_dir.is_dir()
+        assert mock_download.call_args.kwargs["output_dir"].parent == output_dir
+        mock_convert.assert_called_once()
+    
+    def test_process_company_existing_pdf(self, process_mocks, fetcher, mock_submissions, tmp_path):
+        """Test that a company whose latest 10-K PDF exists is not downloaded again."""
+        mock_get_submissions, mock_download, mock_convert = process_mocks
+        mock_get_submissions.return_value = mock_submissions
+        pdf_path = tmp_path / "AAPL_0000320193-25-000079_2025-10-31.pdf"
+        pdf_path.write_bytes(b"%PDF")
         
         result = fetcher.process_company("AAPL", "0000320193", tmp_path)
         
-        assert result is None
+        assert result["pdf_path"] == str(pdf_path)
+        mock_download.assert_not_called()
+        mock_convert.assert_not_called()
 
 
 class TestHelperFunctions:
     """Test helper functions and utilities."""
     
-    @pytest.fixture
-    def fetcher(self):
-        """Create a SEC10KFetcher instance for testing."""
-        return SEC10KFetcher(user_agent="Test Agent", request_delay=0.01)
-    
     def test_ticker_to_cik_mapping(self):
         """Test that all required tickers have CIK mappings."""
         required_tickers = ["AAPL", "META", "GOOGL", "AMZN", "NFLX", "GS"]
         
-        for ticker in required_tickers:
-            assert ticker in TICKER_TO_CIK
-            assert len(TICKER_TO_CIK[ticker]) == 10  # CIK should be 10 digits
+        # Each check reports all offending tickers at once
+        missing = set(required_tickers) - TICKER_TO_CIK.keys()
+        assert not missing, f"missing: {missing}"
+        bad = {t: TICKER_TO_CIK[t] for t in required_tickers if len(TICKER_TO_CIK[t]) != 10}
+        assert not bad, f"CIKs should be 10 digits: {bad}"
+        unmapped = [t for t in required_tickers if CIK_TO_TICKER.get(TICKER_TO_CIK[t]) != t]
+        assert not unmapped, f"missing reverse mappings: {unmapped}"
+        
+        # Shared mapping is read-only
+        with pytest.raises(TypeError):
+            TICKER_TO_CIK["TEST"] = "0000000000"
     
+    @patch.object(SEC10KFetcher, 'close')
     @patch.object(SEC10KFetcher, 'process_company')
-    def test_fetch_10k_reports(self, mock_process, tmp_path):
+    def test_fetch_10k_reports(self, mock_process, mock_close, tmp_path):
         """Test the high-level fetch_10k_reports function."""
-        mock_process.return_value = {
-            "ticker": "AAPL",
-            "cik": "0000320193",
+        # Companies are processed concurrently: the side effect must be
+        # thread-safe and the calls may happen in any order
+        mock_process.side_effect = lambda ticker, cik, output_dir: {
+            "ticker": ticker,
+            "cik": cik,
             "filing_date": "2025-10-31",
             "accession_number": "0000320193-25-000079",
-            "pdf_path": str(tmp_path / "test.pdf")
+            "pdf_path": str(tmp_path / f"{ticker}.pdf")
         }
         
         results = fetch_10k_reports(
             tickers=["AAPL", "META"],
-            output_dir=str(tmp_path)
+            output_dir=str(tmp_path),
+            cache_path=None
         )
         
-        assert len(results) == 2
-        assert mock_process.call_count == 2
+        assert sorted(call.args[0] for call in mock_process.call_args_list) == ["AAPL", "META"]
+        # Results still follow the order of the given tickers
+        assert [r["ticker"] for r in results] == ["AAPL", "META"]
+        # The batch's fetcher releases its session once all companies are done
+        mock_close.assert_called_once()
     
     @patch.object(SEC10KFetcher, 'process_company')
     def test_fetch_10k_reports_invalid_ticker(self, mock_process, tmp_path):
@@ -303,37 +672,160 @@ class TestHelperFunctions:
         
         results = fetch_10k_reports(
             tickers=["INVALID", "AAPL"],
-            output_dir=str(tmp_path)
+            output_dir=str(tmp_path),
+            cache_path=None
         )
         
         # Should skip invalid ticker
         assert len(results) <= 1
+    
+    @pytest.mark.asyncio
+    @patch.object(SEC10KFetcher, 'close')
+    @patch.object(SEC10KFetcher, 'process_company')
+    async def test_afetch_10k_reports(self, mock_process, mock_close, tmp_path):
+        """Test the concurrent afetch_10k_reports function."""
+        mock_process.side_effect = lambda ticker, cik, output_dir: {
+            "ticker": ticker,
+            "cik": cik,
+            "filing_date": "2025-10-31",
+            "accession_number": "0000320193-25-000079",
+            "pdf_path": str(tmp_path / f"{ticker}.pdf")
+        }
+        
+        results = await afetch_10k_reports(
+            tickers=["AAPL", "INVALID", "META"],
+            output_dir=str(tmp_path),
+            cache_path=None
+        )
+        
+        # Invalid ticker is skipped, results keep the input order
+        assert [r["ticker"] for r in results] == ["AAPL", "META"]
+        assert mock_process.call_count == 2
+        mock_close.assert_called_once()
+    
+    @pytest.mark.asyncio
+    @patch.object(SEC10KFetcher, 'process_company')
+    async def test_afetch_10k_reports_concurrent(self, mock_process, tmp_path):
+        """Test that afetch_10k_reports processes companies at the same time."""
+        tickers = ["AAPL", "META", "GOOGL"]
+        # Each company blocks until all of them are in flight, so processing
+        # them one after another breaks the barrier instead of finishing
+        barrier = threading.Barrier(len(tickers), timeout=5)
+        
+        def process(ticker, cik, output_dir):
+            barrier.wait()
+            return {"ticker": ticker, "cik": cik, "pdf_path": str(tmp_path / f"{ticker}.pdf")}
+        
+        mock_process.side_effect = process
+        
+        results = await afetch_10k_reports(
+            tickers=tickers,
+            output_dir=str(tmp_path),
+            max_concurrency=len(tickers),
+            cache_path=None
+        )
+        
+        assert [r["ticker"] for r in results] == tickers
 
 
 class TestErrorHandling:
     """Test error handling scenarios."""
     
-    @pytest.fixture
-    def fetcher(self):
-        return SEC10KFetcher(user_agent="Test Agent", request_delay=0.01)
-    
-    @patch('src.sec10k_fetcher.fetcher.requests.Session.get')
-    def test_rate_limiting(self, mock_get, fetcher):
+    @responses.activate
+    def test_rate_limiting(self):
         """Test that rate limiting delay is applied."""
-        import time
+        # Fake clock: time only moves when the test or the rate limiter says so
+        clock = [100.0]
+        sent = []
+        
+        def advance(seconds):
+            clock[0] += seconds
+        
+        def respond(request):
+            sent.append(clock[0])
+            return 200, {}, '{"cik": "test"}'
         
-        mock_response = Mock()
-        mock_response.json.return_value = {"cik": "test"}
-        mock_response.raise_for_status = Mock()
-        mock_get.return_value = mock_response
+        responses.add_callback(responses.GET, _SUBMISSIONS_URL, callback=respond)
         
-        start = time.time()
+        with patch("src.sec10k_fetcher.fetcher.time.monotonic", side_effect=lambda: clock[0]), \
+                patch("src.sec10k_fetcher.fetcher.time.sleep", side_effect=advance) as mock_sleep:
+            # Own fetcher, so its rate limiter starts on the fake clock
+            fetcher = SEC10KFetcher(
+                user_agent="Test Agent", request_delay=0.01, cache_path=None, submissions_ttl=0
+            )
+            fetcher.get_company_submissions("0000320193")
+            # Time spent between requests counts towards the delay
+            advance(0.005)
+            fetcher.get_company_submissions("0000320193")
+        
+        # The second request waits only for the rest of the request delay
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(0.005)
+        assert sent[1] - sent[0] == pytest.approx(0.01)
+    
+    @patch('src.sec10k_fetcher.fetcher.time.sleep')
+    @patch('src.sec10k_fetcher.fetcher.time.monotonic')
+    def test_rate_limiter_skips_idle_delay(self, mock_monotonic, mock_sleep):
+        """Test that no delay is applied when the last request was long enough ago."""
+        from src.sec10k_fetcher.fetcher import _RateLimiter
+        
+        mock_monotonic.return_value = 100.0
+        limiter = _RateLimiter(rate=100)
+        limiter.acquire()
+        # Idle for longer than the request interval
+        mock_monotonic.return_value = 100.02
+        
+        limiter.acquire()
+        mock_sleep.assert_not_called()
+        # Back-to-back request has to wait for the next token
+        limiter.acquire()
+        mock_sleep.assert_called_once()
+    
+    @responses.activate
+    def test_shared_rate_limiter(self):
+        """Test that a shared rate limiter is acquired before every request."""
+        responses.add(responses.GET, _SUBMISSIONS_URL, json={"cik": "test"})
+        
+        rate_limiter = Mock()
+        fetcher = SEC10KFetcher(
+            user_agent="Test Agent", rate_limiter=rate_limiter, cache_path=None, submissions_ttl=0
+        )
         fetcher.get_company_submissions("0000320193")
         fetcher.get_company_submissions("0000320193")
-        elapsed = time.time() - start
         
-        # Should have at least one delay (0.01 seconds)
-        assert elapsed >= 0.01
+        assert rate_limiter.acquire.call_count == 2
+    
+    @responses.activate
+    def test_rate_limiter_skips_cached_responses(self, tmp_path):
+        """Test that responses served from the HTTP cache don't wait for the rate limiter."""
+        responses.add(responses.GET, _SUBMISSIONS_URL, json={"cik": "test"})
+        
+        rate_limiter = Mock()
+        fetcher = SEC10KFetcher(
+            user_agent="Test Agent", rate_limiter=rate_limiter,
+            cache_path=str(tmp_path / "http_cache"), submissions_ttl=0
+        )
+        try:
+            first = fetcher.get_company_submissions("0000320193")
+            second = fetcher.get_company_submissions("0000320193")
+        finally:
+            fetcher.close()
+        
+        assert first == second == {"cik": "test"}
+        assert len(responses.calls) == 1
+        rate_limiter.acquire.assert_called_once()
+    
+    @responses.activate
+    def test_rate_limit_response(self, fetcher):
+        """Test that an SEC 429 response raises SECRateLimitError with Retry-After."""
+        responses.add(responses.GET, _SUBMISSIONS_URL, status=429, headers={"Retry-After": "30"})
+        
+        with pytest.raises(SECRateLimitError) as exc_info:
+            fetcher.get_company_submissions("0000320193")
+        
+        assert exc_info.value.retry_after == 30
+        # Still an SECAPIError for callers that don't care about the distinction
+        assert isinstance(exc_info.value, SECAPIError)
 
 
 if __name__ == "__main__":